@@ -5,21 +5,23 @@ the usage of the ecs framework while also stress-testing it with heavy calculati
 This example also uses the PygameApp adapter from `ecs.adapters.pygame`
 
 For efficiency - we use numba for the acceleration calculation.
-In a future version - it will also be used for the collision check, currently this is
-the bottleneck when collisions are enabled.
+The collision check uses `scipy.spatial.cKDTree.query_pairs` as a broad phase, so
+the per-tick cost scales ~O(N log N) with the number of planets instead of
+quadratically.
 
 Performance:
 - Currently, the simulation can handle ~2500 planets at 60FPS without
   collisions, with a physics update frequency of 600HZ (600 per second).
   that is 2500 * 2500 * 600 = 3,750,000,000 interactions per second.
-- Since the collision system is not optimized yet (using numpy directly) - with
-  collisions enabled the simulation can handle ~600 planets before dropping below 60FPS.
+- With collisions enabled, the kd-tree broad phase and numba merge keep the
+  per-tick collision cost near-linear in the number of planets.
 
 How to use:
 - Install dependencies:
     - numba
     - pygame
     - numpy <= 2.3.5  (currently required for numba)
+    - scipy
     - ecs-python
 - run gravity_sim.py
 
@@ -41,24 +43,39 @@ Sliders:
 """
 
 import math
-import random
-from copy import copy
 from dataclasses import dataclass
 from functools import partial
 from typing import Any, Type
 
 import numpy as np
 import pygame
-from numba import njit, prange
+from numba import get_num_threads, get_thread_id, njit, prange
+from scipy.spatial import cKDTree
 
 from src.ecs import Component, Event, System, TagComponent, World
 from src.ecs.adapters.pygame import PygameApp
 
+try:
+    from numba import cuda
+    from numba.types import float32 as cuda_f32
+
+    CUDA_AVAILABLE = cuda.is_available()
+except Exception:  # pragma: no cover - no CUDA toolkit installed
+    CUDA_AVAILABLE = False
+
 DEFAULT_G = 0.66743
 PHYSICS_FREQUENCY = 600  # physics updates per second
 PLANET_GROUP_SIZE = 10
-EPS = 1e-10  # minimum distance between objects - avoid infinite forces
+EPS = 1e-6  # minimum distance between objects - avoid infinite forces
+# float32 copy for use inside the kernels - a bare Python float is frozen
+# as a float64 constant by numba and silently promotes the whole chain of
+# arithmetic (and the sqrt) to double precision
+EPS32 = np.float32(EPS)
+ONE32 = np.float32(1.0)
 TRAJECTORY_LENGTH = 100
+GRAVITY_TILE = 64  # bodies per cache tile in the pairwise gravity loop
+GPU_TILE = 128  # threads per block / bodies per shared-memory tile on the GPU
+GPU_MIN_BODIES = 2048  # below this, kernel launch overhead beats the GPU win
 
 # components
 
@@ -68,22 +85,22 @@ class Locked(TagComponent):
 
 
 class Mass(Component):
-    dtype = np.float64
+    dtype = np.float32
     shape = (1,)
 
 
 class Radius(Component):
-    dtype = np.float64
+    dtype = np.float32
     shape = (1,)
 
 
 class Velocity(Component):
-    dtype = np.float64
+    dtype = np.float32
     shape = (2,)
 
 
 class Position(Component):
-    dtype = np.float64
+    dtype = np.float32
     shape = (2,)
 
 
@@ -106,6 +123,11 @@ class PlanetSpawnEvent(Event):
     is_locked: bool
 
 
+@dataclass
+class OutOfBoundsEvent(Event):
+    entity_ids: np.ndarray
+
+
 @dataclass
 class ToggleSystemEvent(Event):
     system_type: Type[System]
@@ -120,27 +142,214 @@ class ResourceChangedEvent(Event):
 # helper functions
 
 
-@njit(parallel=True, cache=True)
-def calculate_gravity(pos: np.ndarray, mass: np.ndarray, g: float) -> np.ndarray:
+# eager signature - the kernel is compiled once at import time instead of
+# lazily on the first physics tick, so there is no first-frame JIT stall
+@njit(
+    "void(float32[:,:], float32[:,:], float32[:], boolean[:], float32, float32)",
+    parallel=True,
+    fastmath=True,
+    cache=True,
+)
+def physics_step(
+    pos: np.ndarray,
+    vel: np.ndarray,
+    mass: np.ndarray,
+    locked: np.ndarray,
+    g: float,
+    dt: float,
+) -> None:
+    """Fused gravity + leapfrog integration - one pass over the body arrays.
+
+    Computes pairwise accelerations, then `vel += acc*dt; pos += vel*dt`
+    in the same kernel, so pos/vel are streamed through memory once per
+    tick instead of once per system. Locked bodies attract others but are
+    not integrated.
+    """
     n = pos.shape[0]
-    acc = np.zeros((n, 2), dtype=np.float64)
+    # Newton's third law - each pair is computed once and applied to both bodies
+    # with opposing signs, halving the work of the full NxN loop.
+    # Each thread accumulates into its own slab to keep prange race-free.
+    # The (i, j) iteration is tiled so a block of j-bodies stays hot in L1
+    # while it is reused across a whole block of i-bodies.
+    acc_local = np.zeros((get_num_threads(), n, 2), dtype=np.float32)
+    num_blocks = (n + GRAVITY_TILE - 1) // GRAVITY_TILE
+    for bi in prange(num_blocks):
+        tid = get_thread_id()
+        ii = bi * GRAVITY_TILE
+        i_end = min(ii + GRAVITY_TILE, n)
+        for jj in range(ii, n, GRAVITY_TILE):
+            j_end = min(jj + GRAVITY_TILE, n)
+            for i in range(ii, i_end):
+                # hoist body i into scalars so they stay in registers
+                xi = pos[i, 0]
+                yi = pos[i, 1]
+                mi = mass[i]
+                axi = np.float32(0.0)
+                ayi = np.float32(0.0)
+                for j in range(max(jj, i + 1), j_end):
+                    dx = pos[j, 0] - xi
+                    dy = pos[j, 1] - yi
+
+                    # add epsilon to avoid infinite forces
+                    dist_sq = dx * dx + dy * dy + EPS32
+
+                    # f = g * mi * mj / r^3 -> a = g * mj / r^3
+                    # reciprocal sqrt + multiplies keep the divide off the
+                    # critical path (with fastmath LLVM can emit rsqrt + FMA)
+                    inv_r = ONE32 / math.sqrt(dist_sq)
+                    a = g * inv_r * inv_r * inv_r
+                    ax = a * dx
+                    ay = a * dy
+
+                    # apply new force on acceleration components of both bodies
+                    axi += mass[j] * ax
+                    ayi += mass[j] * ay
+                    acc_local[tid, j, 0] -= mi * ax
+                    acc_local[tid, j, 1] -= mi * ay
+                acc_local[tid, i, 0] += axi
+                acc_local[tid, i, 1] += ayi
+
+    # reduce the thread slabs and integrate in the same pass
+    num_threads = acc_local.shape[0]
     for i in prange(n):
-        for j in range(n):
-            if i == j:
-                continue
-            dx = pos[j, 0] - pos[i, 0]
-            dy = pos[j, 1] - pos[i, 1]
+        if locked[i]:
+            continue
+        ax = np.float32(0.0)
+        ay = np.float32(0.0)
+        for t in range(num_threads):
+            ax += acc_local[t, i, 0]
+            ay += acc_local[t, i, 1]
+        vel[i, 0] += ax * dt
+        vel[i, 1] += ay * dt
+        pos[i, 0] += vel[i, 0] * dt
+        pos[i, 1] += vel[i, 1] * dt
+
+
+@njit(
+    "void(float32[:,:], float32[:,:], float32[:,:], boolean[:], float32)",
+    parallel=True,
+    fastmath=True,
+    cache=True,
+)
+def integrate_step(
+    pos: np.ndarray,
+    vel: np.ndarray,
+    acc: np.ndarray,
+    locked: np.ndarray,
+    dt: float,
+) -> None:
+    """Leapfrog integration for accelerations computed elsewhere (GPU path)"""
+    for i in prange(pos.shape[0]):
+        if locked[i]:
+            continue
+        vel[i, 0] += acc[i, 0] * dt
+        vel[i, 1] += acc[i, 1] * dt
+        pos[i, 0] += vel[i, 0] * dt
+        pos[i, 1] += vel[i, 1] * dt
+
+
+if CUDA_AVAILABLE:
+
+    @cuda.jit
+    def _gravity_kernel_gpu(pos, mass, g, acc):
+        """One thread per i-body; j-bodies are staged through a shared tile.
+
+        The whole block cooperatively loads GPU_TILE bodies into shared
+        memory, then every thread accumulates that tile's contribution -
+        the canonical n-body tiling. The EPS softening zeroes the i == j
+        self-interaction, so no branch is needed for it.
+        """
+        i = cuda.grid(1)
+        tx = cuda.threadIdx.x
+        n = pos.shape[0]
+        tile = cuda.shared.array((GPU_TILE, 3), dtype=cuda_f32)
+
+        # float32 literals/constants throughout - fp64 arithmetic runs at a
+        # fraction of fp32 throughput on consumer GPUs
+        xi = pos[i, 0] if i < n else np.float32(0.0)
+        yi = pos[i, 1] if i < n else np.float32(0.0)
+        ax = np.float32(0.0)
+        ay = np.float32(0.0)
+        for start in range(0, n, GPU_TILE):
+            j = start + tx
+            if j < n:
+                tile[tx, 0] = pos[j, 0]
+                tile[tx, 1] = pos[j, 1]
+                tile[tx, 2] = mass[j]
+            cuda.syncthreads()
+            if i < n:
+                for k in range(min(GPU_TILE, n - start)):
+                    dx = tile[k, 0] - xi
+                    dy = tile[k, 1] - yi
+                    dist_sq = dx * dx + dy * dy + EPS32
+                    inv_r = ONE32 / math.sqrt(dist_sq)
+                    a = g * tile[k, 2] * inv_r * inv_r * inv_r
+                    ax += a * dx
+                    ay += a * dy
+            cuda.syncthreads()
+        if i < n:
+            acc[i, 0] = ax
+            acc[i, 1] = ay
+
+    def calculate_gravity_gpu(
+        pos: np.ndarray, mass: np.ndarray, g: float
+    ) -> np.ndarray:
+        n = pos.shape[0]
+        acc = np.empty((n, 2), dtype=np.float32)
+        blocks = (n + GPU_TILE - 1) // GPU_TILE
+        d_pos = cuda.to_device(pos)
+        d_mass = cuda.to_device(mass)
+        d_acc = cuda.device_array((n, 2), dtype=np.float32)
+        _gravity_kernel_gpu[blocks, GPU_TILE](d_pos, d_mass, np.float32(g), d_acc)
+        d_acc.copy_to_host(acc)
+        return acc
+
+
+@njit(cache=True)
+def resolve_collisions(
+    pairs: np.ndarray,
+    mass: np.ndarray,
+    radius: np.ndarray,
+    vel: np.ndarray,
+    locked: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Merge colliding pairs in place and return (alive, changed) masks.
+
+    Runs the same sequential winner-takes-loser merge as the old Python loop
+    (heavier body absorbs the lighter one, momentum conserved), but tracks
+    removed bodies with a bool mask instead of list membership scans.
+    """
+    n = mass.shape[0]
+    alive = np.ones(n, dtype=np.bool_)
+    changed = np.zeros(n, dtype=np.bool_)
+    for p in range(pairs.shape[0]):
+        i = pairs[p, 0]
+        j = pairs[p, 1]
+        if not alive[i] or not alive[j]:
+            # one of the bodies already collided and was removed
+            continue
+        if mass[i] > mass[j]:
+            winner, loser = i, j
+        else:
+            winner, loser = j, i
 
-            dist_sq = dx * dx + dy * dy + EPS  # add epsilon to avoid infinite forces
-            dist = np.sqrt(dist_sq)
+        new_mass = mass[winner] + mass[loser]
+        new_radius = (new_mass / 10.0) ** (1.0 / 3.0)  # inverse of _rad_to_mass
 
-            # f = g * mi * mj / r^3 -> a = g * mj / r^3
-            a = g * mass[j, 0] / (dist * dist_sq)
+        # conserve momentum
+        vx = (mass[winner] * vel[winner, 0] + mass[loser] * vel[loser, 0]) / new_mass
+        vy = (mass[winner] * vel[winner, 1] + mass[loser] * vel[loser, 1]) / new_mass
+        if locked[winner]:
+            vx = 0.0
+            vy = 0.0
 
-            # apply new force on acceleration components
-            acc[i, 0] += a * dx
-            acc[i, 1] += a * dy
-    return acc
+        mass[winner] = new_mass
+        radius[winner] = new_radius
+        vel[winner, 0] = vx
+        vel[winner, 1] = vy
+        alive[loser] = False
+        changed[winner] = True
+    return alive, changed
 
 
 def _rad_to_mass(r: float) -> float:
@@ -159,49 +368,105 @@ class AccelerationSystem(System):
 
     def initialize(self, world: World) -> None:
         self.queries["planets"] = world.query(include=[Mass, Position])
+        # persistent SoA scratch buffers - `gather()` allocates fresh arrays on
+        # every call, which at 600HZ becomes pure allocation churn. The archetype
+        # storage is already contiguous per component, so we only pay a copy into
+        # buffers whose capacity persists across ticks.
+        self._pos = np.empty((0, 2), dtype=np.float32)
+        self._vel = np.empty((0, 2), dtype=np.float32)
+        self._mass = np.empty(0, dtype=np.float32)
+        self._locked = np.empty(0, dtype=np.bool_)
+        # resource values are cached locally and refreshed by events - at
+        # 600HZ the per-tick dict lookups are measurable
+        self._g = world.resources.get("G", DEFAULT_G)
+        self._cleanup_dist_sq = world.resources.get("cleanup_dist", 3000) ** 2
+        world.event_bus.subscribe(ResourceChangedEvent, self._on_resource_changed)
+
+    def _on_resource_changed(self, event: ResourceChangedEvent) -> None:
+        if event.key == "G":
+            self._g = event.value
+        elif event.key == "cleanup_dist":
+            self._cleanup_dist_sq = event.value**2
+
+    def _movable(self, arch) -> bool:
+        return Velocity in arch.components and Locked not in arch.components
+
+    def _gather_planets(self) -> tuple[int, dict]:
+        """Copy planet state into the reused scratch buffers (no allocation)"""
+        matches = self.queries["planets"].matches
+        total = sum(len(arch) for arch in matches)
+        if total > self._pos.shape[0]:
+            capacity = max(total, 2 * self._pos.shape[0])
+            self._pos = np.empty((capacity, 2), dtype=np.float32)
+            self._vel = np.empty((capacity, 2), dtype=np.float32)
+            self._mass = np.empty(capacity, dtype=np.float32)
+            self._locked = np.empty(capacity, dtype=np.bool_)
+        slices = {}
+        idx = 0
+        for arch in matches:
+            count = len(arch)
+            if count == 0:
+                continue
+            curr_slice = slice(idx, idx + count)
+            self._pos[curr_slice] = arch.storage[Position][:count]
+            self._mass[curr_slice] = arch.storage[Mass][:count]
+            if Velocity in arch.components:
+                self._vel[curr_slice] = arch.storage[Velocity][:count]
+            else:
+                self._vel[curr_slice] = 0.0
+            # bodies without Velocity still attract others - treat as locked
+            self._locked[curr_slice] = not self._movable(arch)
+            slices[arch] = curr_slice
+            idx += count
+        return total, slices
 
     def update(self, world: World, dt: float) -> None:
-        g_const = world.resources.get("G", DEFAULT_G)
+        g_const = self._g
 
-        gather_res = self.queries["planets"].gather()
-        if len(gather_res.ids) == 0:
+        total, slices = self._gather_planets()
+        if total == 0:
             return
 
-        # calculate forces using numba
-        acc = calculate_gravity(gather_res[Position], gather_res[Mass], g_const)
-
-        for arch, entities, arch_data in self.queries["planets"].fetch(
-            optional=[Velocity, Locked]
-        ):
-            if (
-                arch in gather_res.slices.keys()
-                and Locked not in arch.components
-                and Velocity in arch.components
-            ):
-                arch_data[Velocity] += acc[gather_res.slices[arch]] * dt
-
-
-class MovementSystem(System):
-    group = "physics"
+        pos = self._pos[:total]
+        vel = self._vel[:total]
+        mass = self._mass[:total]
+        locked = self._locked[:total]
 
-    def initialize(self, world: World) -> None:
-        self.queries["planets"] = world.query(
-            include=[Mass, Position, Velocity], exclude=[Locked]
-        )
+        # fused gravity + integration - offload the pairwise part to the GPU
+        # for large N, where launch + transfer overhead is amortized
+        if CUDA_AVAILABLE and total > GPU_MIN_BODIES:
+            acc = calculate_gravity_gpu(pos, mass, g_const)
+            integrate_step(pos, vel, acc, locked, dt)
+        else:
+            physics_step(pos, vel, mass, locked, g_const, dt)
 
-    def update(self, world: World, dt: float) -> None:
-        for _, _, data in self.queries["planets"].fetch():
-            data[Position] += data[Velocity] * dt
+        # scatter the integrated state back, and flag runaway planets while
+        # their positions are still hot instead of re-scanning in cleanup
+        cleanup_dist_sq = self._cleanup_dist_sq
+        for arch, curr_slice in slices.items():
+            if not self._movable(arch):
+                continue
+            count = curr_slice.stop - curr_slice.start
+            arch.storage[Position][:count] = self._pos[curr_slice]
+            arch.storage[Velocity][:count] = self._vel[curr_slice]
+            out_of_bounds = np.sum(self._pos[curr_slice] ** 2, axis=1) > cleanup_dist_sq
+            if out_of_bounds.any():
+                world.event_bus.publish_async(
+                    OutOfBoundsEvent(entity_ids=arch.entity_ids[:count][out_of_bounds])
+                )
 
 
 class CollisionSystem(System):
-    # TODO - use numba, query.gather
+    # TODO - use query.gather
     group = "default"  # update frequency is lower to avoid performance issues
 
     def initialize(self, world: World) -> None:
         self.queries["planets"] = world.query(
             include=[Mass, Position, Radius, Velocity]
         )
+        # locked-ness is a property of the archetype, not of the entity -
+        # cache it per signature instead of allocating a flag array per tick
+        self._arch_locked: dict[int, bool] = {}
 
     def update(self, world: World, dt: float) -> None:
 
@@ -210,7 +475,8 @@ class CollisionSystem(System):
         all_vel = []
         all_mass = []
         all_radius = []
-        all_locked_flags = []
+        arch_locked = []
+        counts = []
 
         for arch, entities, data in self.queries["planets"].fetch(optional=[Locked]):
             all_ids.append(entities)
@@ -218,11 +484,12 @@ class CollisionSystem(System):
             all_vel.append(data[Velocity])
             all_mass.append(data[Mass])
             all_radius.append(data[Radius])
-            all_locked_flags.append(
-                np.ones(len(entities), dtype=np.bool_)
-                if Locked in arch.components
-                else np.zeros(len(entities), dtype=np.bool_)
-            )
+            locked = self._arch_locked.get(arch.signature)
+            if locked is None:
+                locked = Locked in arch.components
+                self._arch_locked[arch.signature] = locked
+            arch_locked.append(locked)
+            counts.append(len(entities))
 
         if not all_ids:
             return
@@ -230,73 +497,65 @@ class CollisionSystem(System):
         ids = np.concatenate(all_ids)
         pos = np.concatenate(all_pos)
         vel = np.concatenate(all_vel)
-        mass = np.concatenate(all_mass).flatten()
-        radius = np.concatenate(all_radius).flatten()
-        locked_flags = np.concatenate(all_locked_flags)
+        mass = np.concatenate(all_mass)
+        radius = np.concatenate(all_radius)
+        locked_flags = np.repeat(arch_locked, counts)
 
         if len(ids) == 1:
             return  # skip if there is one entity
 
-        # calculate collisions
-        diff = pos[None, :, :] - pos[:, None, :]
-        dist_sq = np.sum(diff**2, axis=2)
-        sum_radius = radius[None, :] + radius[:, None]
-        collision_mask = dist_sq < (sum_radius**2)
-        np.fill_diagonal(collision_mask, False)
-
-        to_remove = []
-        for i in range(len(ids)):
-            if ids[i] in to_remove:
-                continue
-
-            collisions = np.where(collision_mask[i])[0]
-            for j in collisions:
-                if ids[j] in to_remove:
-                    # j already collided and was removed
-                    continue
-                winner, loser = (i, j) if mass[i] > mass[j] else (j, i)
-                winner_id, loser_id = (ids[winner], ids[loser])
-
-                new_mass = mass[winner] + mass[loser]
-                new_radius = _mass_to_rad(new_mass)
+        # broad phase - all pairs within 2 * max_radius in one C call
+        tree = cKDTree(pos)
+        pairs = tree.query_pairs(r=2.0 * radius.max(), output_type="ndarray")
+        if len(pairs) == 0:
+            return
 
-                # conserve momentum
-                new_velocity = (
-                    mass[winner] * vel[winner] + mass[loser] * vel[loser]
-                ) / new_mass
-                if locked_flags[winner]:
-                    new_velocity = (0.0, 0.0)
+        # narrow phase - exact per-pair overlap test, vectorized
+        diff = pos[pairs[:, 0]] - pos[pairs[:, 1]]
+        r_sum = radius[pairs[:, 0]] + radius[pairs[:, 1]]
+        overlap = np.einsum("ij,ij->i", diff, diff) < r_sum**2
+        pairs = pairs[overlap].astype(np.int32)
 
-                # update local arrays
-                mass[winner] = new_mass
-                radius[winner] = new_radius
-                vel[winner] = new_velocity
+        if len(pairs) == 0:
+            return
 
-                world.set_component(winner_id, Mass, new_mass)
-                world.set_component(winner_id, Radius, new_radius)
-                world.set_component(winner_id, Velocity, new_velocity)
-                to_remove.append(loser_id)
-                if loser == i:
-                    break
+        alive, changed = resolve_collisions(pairs, mass, radius, vel, locked_flags)
 
-        for eid in set(to_remove):
-            world.cmd_buffer.remove_entity(eid)
+        # scatter merged winners back to the world, drop absorbed losers
+        for i in np.where(changed & alive)[0]:
+            world.set_component(ids[i], Mass, mass[i])
+            world.set_component(ids[i], Radius, radius[i])
+            world.set_component(ids[i], Velocity, vel[i])
+        removed = ids[~alive]
+        if len(removed) > 0:
+            world.cmd_buffer.remove_entities(removed)
 
 
 class CleanupSystem(System):
     group = "cleanup"
 
     def initialize(self, world: World) -> None:
-        self.queries["planets"] = world.query(include=[Mass, Position])
+        # handlers must be kept alive so the weak reference won't be removed
+        self._handler = partial(self._remove_out_of_bounds, world=world)
+        self._pending: set[int] = set()
+        world.event_bus.subscribe(OutOfBoundsEvent, self._handler)
 
     def update(self, world: World, dt: float) -> None:
-        cleanup_dist_sq = world.resources.get("cleanup_dist", 3000) ** 2
-        for _, entities, data in self.queries["planets"].fetch():
-            dist_squares = np.sum(data[Position] ** 2, axis=1)
-            remove_mask = dist_squares > cleanup_dist_sq
-            entities_to_remove = entities[remove_mask]
-            for entity in entities_to_remove:
-                world.cmd_buffer.remove_entity(entity)
+        """Removals happen in the event handler - only reset the dedup set"""
+        self._pending.clear()
+
+    def _remove_out_of_bounds(self, event: OutOfBoundsEvent, world: World) -> None:
+        # the same planet may be reported by several physics ticks before
+        # the removal is flushed - only buffer it once, and skip entities
+        # that were already removed (e.g. merged by a collision)
+        new_ids = [
+            eid
+            for eid in map(int, event.entity_ids)
+            if eid not in self._pending and eid in world.entities.entities_map
+        ]
+        if new_ids:
+            self._pending.update(new_ids)
+            world.cmd_buffer.remove_entities(new_ids)
 
 
 class GravityRenderSystem(System):
@@ -304,21 +563,38 @@ class GravityRenderSystem(System):
 
     def initialize(self, world: World):
         self.queries["renderables"] = world.query(include=[Position, Color, Radius])
+        # circle surfaces pre-rendered per (radius, color), so a frame is a
+        # single batched `blits` call instead of N `draw.circle` calls.
+        # the cache is bounded by the number of distinct planets spawned.
+        self._circle_cache: dict[tuple[int, ...], pygame.Surface] = {}
+        # the screen never changes - avoid the per-frame resource lookup
+        self._screen = world.resources.get_as("pygame.screen", pygame.Surface)
+
+    def _get_circle(self, r: int, col: tuple[int, int, int]) -> pygame.Surface:
+        key = (r, *col)
+        surf = self._circle_cache.get(key)
+        if surf is None:
+            surf = pygame.Surface((2 * r + 1, 2 * r + 1), pygame.SRCALPHA)
+            pygame.draw.circle(surf, col, (r, r), r)
+            self._circle_cache[key] = surf
+        return surf
 
     def update(self, world: World, dt: float) -> None:
-        screen = world.resources.get_as("pygame.screen", pygame.Surface)
+        screen = self._screen
+        blit_seq = []
         for _, _, data in self.queries["renderables"].fetch():
             pos_batch = data[Position]
-            col_batch = data[Color]
+            col_batch = data[Color].astype(np.int32)
             radius = data[Radius]
             for i in range(len(pos_batch)):
-                p, col, r = pos_batch[i], col_batch[i], radius[i]
-                pygame.draw.circle(
-                    screen,
-                    (int(col[0]), int(col[1]), int(col[2])),
-                    (int(p[0]), int(p[1])),
-                    int(r[0]),
+                r = int(radius[i])
+                col = (col_batch[i, 0], col_batch[i, 1], col_batch[i, 2])
+                surf = self._get_circle(r, col)
+                blit_seq.append(
+                    (surf, (int(pos_batch[i, 0]) - r, int(pos_batch[i, 1]) - r))
                 )
+        if blit_seq:
+            screen.blits(blit_seq)
 
 
 class TrajectoryStorageSystem(System):
@@ -342,9 +618,10 @@ class TrajectoryRenderSystem(System):
 
     def initialize(self, world: World):
         self.queries["trajectory"] = world.query(include=[Trajectory, Color])
+        self._screen = world.resources.get_as("pygame.screen", pygame.Surface)
 
     def update(self, world: World, dt: float) -> None:
-        screen = world.resources.get_as("pygame.screen", pygame.Surface)
+        screen = self._screen
         for _, _, data in self.queries["trajectory"].fetch():
             traj_batch = data[Trajectory]
             col_batch = data[Color]
@@ -364,22 +641,23 @@ class SpawnerSystem(System):
 
     def initialize(self, world: World) -> None:
         self._handler = partial(self._spawn, world=world)
+        # a single Generator call per spawn instead of one random.randint
+        # per color channel
+        self._rng = np.random.default_rng()
         world.event_bus.subscribe(PlanetSpawnEvent, self._handler)
 
     def update(self, world: World, dt: float) -> None:
         """Skip update - subscriber only"""
         pass
 
-    @staticmethod
-    def _spawn(event: PlanetSpawnEvent, world: World) -> None:
+    def _spawn(self, event: PlanetSpawnEvent, world: World) -> None:
+        color = self._rng.integers(100, 256, size=3).astype(np.float32)
+        color[2] = 255.0
         comps = {
             Position: event.position,
             Velocity: event.velocity if not event.is_locked else (0, 0),
             Mass: _rad_to_mass(event.radius),
-            Color: np.array(
-                [random.randint(100, 255), random.randint(100, 255), 255],
-                dtype=np.float32,
-            ),
+            Color: color,
             Radius: event.radius,
         }
         if event.is_locked:
@@ -435,8 +713,12 @@ class GravitySim(PygameApp):
         self.register_group("physics", PHYSICS_FREQUENCY)
         self.register_group("cleanup", 1.0)
 
+        # Defaults - set before the systems are registered so initialize()
+        # hooks can cache the values
+        self.world.resources["G"] = 0.667
+        self.world.resources["time_scale"] = 1.0
+
         self.world.register_system(AccelerationSystem(priority=0))
-        self.world.register_system(MovementSystem(priority=5))
         self.world.register_system(CleanupSystem(priority=10))
         self.world.register_system(CollisionSystem(priority=15))
         self.world.register_system(GravityRenderSystem(priority=20))
@@ -445,11 +727,8 @@ class GravitySim(PygameApp):
         self.world.register_system(TrajectoryStorageSystem(priority=16))
         self.world.register_system(TrajectoryRenderSystem(priority=21))
 
-        # Defaults
-        self.world.resources["G"] = 0.667
-        self.world.resources["time_scale"] = 1.0
-
         self.font = pygame.font.SysFont("Consolas", 14)
+        self._rng = np.random.default_rng()
         self.dragging = False
         self.start_pos = (0, 0)
         self.selected_r = 20.0
@@ -465,12 +744,6 @@ class GravitySim(PygameApp):
 
         self.drag_target = None
 
-        # pre-initialize numba to avoid startup lag
-        # TODO - find better way to do this
-        dummy_pos = np.zeros((2, 2), dtype=np.float64)
-        dummy_mass = np.zeros((2, 1), dtype=np.float64)
-        calculate_gravity(dummy_pos, dummy_mass, 1.0)
-
     def on_event(self, event):
         mx, my = pygame.mouse.get_pos()
 
@@ -515,13 +788,20 @@ class GravitySim(PygameApp):
                 if event.button == pygame.BUTTON_LEFT:
                     self.world.event_bus.publish_async(spawn_event)
                 else:
-                    # right click - spawn X
-                    for _ in range(PLANET_GROUP_SIZE):
-                        new_spawn_event = copy(spawn_event)
-                        new_x = spawn_event.position[0] + (random.random() - 0.5) * 50
-                        new_y = spawn_event.position[1] + (random.random() - 0.5) * 50
-                        new_spawn_event.position = (new_x, new_y)
-                        self.world.event_bus.publish_async(new_spawn_event)
+                    # right click - spawn X, drawing all offsets in one call.
+                    # construct the events directly - copy() on a dataclass
+                    # goes through __reduce_ex__ reflection and is ~10x slower
+                    offsets = (self._rng.random((PLANET_GROUP_SIZE, 2)) - 0.5) * 50
+                    sx, sy = spawn_event.position
+                    for dx, dy in offsets:
+                        self.world.event_bus.publish_async(
+                            PlanetSpawnEvent(
+                                position=(sx + dx, sy + dy),
+                                velocity=spawn_event.velocity,
+                                radius=spawn_event.radius,
+                                is_locked=spawn_event.is_locked,
+                            )
+                        )
 
         if event.type == pygame.MOUSEMOTION and self.drag_target:
             if self.drag_target == "radius":
@@ -84,13 +84,19 @@ class PygameApp:
             for grp, config in self.groups_config.items():
                 config["accumulator"] += render_dt * time_scale
 
-                limit = max_accumulator + config["interval"]
+                interval = config["interval"]
+                limit = max_accumulator + interval
                 if config["accumulator"] > limit:
                     config["accumulator"] = max_accumulator
 
-                while config["accumulator"] >= config["interval"]:
-                    self.world.update(config["interval"], group=grp)
-                    config["accumulator"] -= config["interval"]
+                if interval <= 0:
+                    continue
+                # batch all pending fixed steps into one update call instead
+                # of dispatching the world once per step on catch-up frames
+                steps = int(config["accumulator"] // interval)
+                if steps > 0:
+                    self.world.update(interval, group=grp, n_steps=steps)
+                    config["accumulator"] -= steps * interval
 
             self.screen.fill((0, 0, 0))
             self.on_pre_render(screen=self.screen)
@@ -31,18 +31,24 @@ class PygameRenderSystem(System):
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self.query = None
+        self.screen = None
 
     def initialize(self, world: World) -> None:
         self.query = world.query(include=[Transform, Sprite])
+        # the screen surface does not change over the app's lifetime -
+        # resolve the string-keyed resource once instead of per frame
+        self.screen = world.resources.get_as("pygame.screen", pygame.Surface)
 
     def update(self, world: World, dt: float) -> None:
-        screen = world.resources.get_as("pygame.screen", pygame.Surface)
+        screen = self.screen
         for _, _, data in self.query.fetch(optional=[DisableRender]):
             positions = data[Transform]
             surfaces = data[Sprite]
 
             if DisableRender in data:
-                is_visible = ~data[DisableRender].astype(bool).ravel()
+                is_visible = ~data[DisableRender].ravel()
                 positions = positions[is_visible]
                 surfaces = surfaces[is_visible]
-            screen.blits(zip(surfaces, positions))
+            # tolist() converts the whole batch to Python objects in one C
+            # pass, so pygame does not unbox a numpy scalar per coordinate
+            screen.blits(zip(surfaces.tolist(), positions.tolist()))
@@ -2,10 +2,29 @@ from typing import Type
 
 import numpy as np
 
-from .component import Component, TagComponent
+from .component import Component
 
 
 class Archetype:
+    # fixed attribute layout - archetype attributes are read in every hot
+    # loop, and slots skip the per-instance __dict__ lookup
+    __slots__ = (
+        "signature",
+        "index",
+        "components",
+        "_capacity",
+        "storage",
+        "_storage_arrays",
+        "entity_ids",
+        "_length",
+        "add_edges",
+        "remove_edges",
+        "_view_len",
+        "_live_ids",
+        "_live_storage",
+        "_resize_gen",
+    )
+
     def __init__(
         self,
         components: list[Type[Component]],
@@ -39,31 +58,89 @@ class Archetype:
                 up automatically when needed, but does not scale down.
         """
         self.signature = signature
+        self.index = -1  # position in the EntityManager's archetype list
         self.components = set(components)
         self._capacity = initial_capacity
+        # scalar components (shape (1,)) are stored as flat 1-D columns -
+        # dropping the trailing unit dim makes per-row access a plain scalar
+        # load/store instead of a length-1 view
         self.storage: dict[Type[Component], np.ndarray] = {
-            c: np.empty((self._capacity, *c.shape), dtype=c.dtype)
+            c: np.empty(
+                self._capacity if c.shape == (1,) else (self._capacity, *c.shape),
+                dtype=c.dtype,
+            )
             for c in components
-            if not issubclass(c, TagComponent)
+            if not c._is_tag
         }
+        # flat tuple of the storage arrays - hot paths iterate this instead
+        # of going through the dict view on every call
+        self._storage_arrays = tuple(self.storage.values())
         self.entity_ids = np.full(self._capacity, -1, dtype=np.int64)
         self._length = 0
+        # transition graph edges, filled lazily by the EntityManager - maps a
+        # set of added/removed component types to the adjacent archetype so
+        # repeated mutations skip the signature recomputation entirely
+        self.add_edges: dict[frozenset[Type[Component]], "Archetype"] = {}
+        self.remove_edges: dict[frozenset[Type[Component]], "Archetype"] = {}
+        # length-bound views over entity_ids/storage, rebuilt only when the
+        # entity count changes (see live_views)
+        self._view_len = -1
+        self._live_ids: np.ndarray = self.entity_ids[:0]
+        self._live_storage: dict[Type[Component], np.ndarray] = {}
+        # bumped on every in-place resize: a realloc can move the buffers,
+        # so views minted before a resize are invalid even if the length
+        # later returns to its old value. Consumers that cache views stamp
+        # them with (length, resize generation) to witness that.
+        self._resize_gen = 0
 
     def __len__(self) -> int:
         return self._length
 
     def increase_capacity(self):
-        """Double the capacity of the archetype arrays"""
-        new_capacity = self._capacity * 2
-        new_entities = np.full(new_capacity, -1, dtype=np.int64)
-        new_entities[: self._length] = self.entity_ids[: self._length]
-        self.entity_ids = new_entities
-
-        for comp, data in self.storage.items():
-            _new_data = np.empty((new_capacity, *data.shape[1:]), dtype=data.dtype)
-            _new_data[: self._length] = data[: self._length]
-            self.storage[comp] = _new_data
+        """Double the capacity of the archetype arrays
+
+        The arrays are resized in place (realloc) - when the heap can extend
+        the block this avoids the alloc + full copy of a fresh buffer, and the
+        array objects (and any cached references to them) stay valid.
+
+        Note:
+            refcheck is disabled, so views taken before the resize (e.g. from
+            a query fetch) must not be used across structural changes - which
+            is already the contract for query results.
+        """
+        self._resize(self._capacity * 2)
+
+    def reserve(self, additional: int):
+        """Ensure capacity for `additional` more entities with a single resize
+
+        Bulk insertions should call this once up front instead of letting
+        `allocate` double the arrays repeatedly inside the loop.
+
+        Args:
+            additional: number of entities about to be added
+        """
+        needed = self._length + additional
+        if needed <= self._capacity:
+            return
+        new_capacity = self._capacity
+        while new_capacity < needed:
+            new_capacity *= 2
+        self._resize(new_capacity)
+
+    def _resize(self, new_capacity: int):
+        self.entity_ids.resize(new_capacity, refcheck=False)
+        length = self._length
+        self.entity_ids[length:] = -1
+
+        for data in self.storage.values():
+            data.resize((new_capacity, *data.shape[1:]), refcheck=False)
         self._capacity = new_capacity
+        # the realloc may have moved the buffers - drop the cached views so
+        # live_views rebuilds them before anyone dereferences stale memory,
+        # and bump the generation so externally cached views are witnessed
+        # as stale even after live_views has been rebuilt
+        self._view_len = -1
+        self._resize_gen += 1
 
     def allocate(self, entity_id: int) -> int:
         """Add a new entity to the archetype
@@ -86,6 +163,51 @@ class Archetype:
         self._length += 1
         return row
 
+    def allocate_n(self, entity_ids: np.ndarray) -> int:
+        """Add a batch of entities to the archetype in one contiguous block
+
+        Grows the arrays once if needed and writes all ids with a single
+        slice assignment. Like `allocate`, this does not insert component
+        data - the EntityManager stores whole columns into the returned
+        row range.
+
+        Args:
+            entity_ids: ids of the entities to add
+        Returns:
+            row0 (int): the first row of the allocated block; the batch
+                occupies rows [row0, row0 + len(entity_ids))
+        """
+        n = len(entity_ids)
+        self.reserve(n)
+        row0 = self._length
+        row1 = row0 + n
+        self.entity_ids[row0:row1] = entity_ids
+        self._length += n
+        return row0
+
+    def live_views(
+        self,
+    ) -> tuple[np.ndarray, dict[Type[Component], np.ndarray]]:
+        """Get views of the valid rows of entity_ids and every storage column
+
+        The views are cached and only rebuilt when the entity count has
+        changed since the last call, so repeated fetches within a frame
+        reuse the same view objects instead of re-slicing per call. The
+        storage arrays grow in place, so cached views remain backed by
+        valid memory; like query results, they must not be held across
+        structural changes.
+
+        Returns:
+            (entity_ids view, {component: storage view}) covering the first
+            `len(self)` rows
+        """
+        if self._view_len != self._length:
+            n = self._length
+            self._live_ids = self.entity_ids[:n]
+            self._live_storage = {c: s[:n] for c, s in self.storage.items()}
+            self._view_len = n
+        return self._live_ids, self._live_storage
+
     def remove_entity(self, row_id) -> int:
         """Remove entity from archetype by row
 
@@ -106,8 +228,11 @@ class Archetype:
 
         if row_id != last_id:
             moved_entity = int(self.entity_ids[last_id])
-            for data in self.storage.values():
-                data[row_id] = data[last_id]
+            row_end = row_id + 1
+            last_end = last_id + 1
+            for data in self._storage_arrays:
+                # slice assignment skips the advanced-indexing scalar path
+                data[row_id:row_end] = data[last_id:last_end]
             self.entity_ids[row_id] = moved_entity
         self.entity_ids[last_id] = -1
         self._length -= 1
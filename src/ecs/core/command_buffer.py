@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import threading
 from typing import TYPE_CHECKING, Any, Type
 
 from .component import Component
@@ -9,42 +10,160 @@ if TYPE_CHECKING:
 
 
 class CommandBuffer:
+    __slots__ = ("world", "_commands", "_reserved_ids", "_dispatch", "_staging")
+
     def __init__(self, world: World):
         self.world = world
         self._commands = []
         self._reserved_ids = []
+        # thread-local staging queues for parallel waves: each system's
+        # commands are held privately while it runs and merged into the
+        # shared queues only on clean return (see run_staged)
+        self._staging = threading.local()
+        # command tag -> bound executor, so flush resolves each command with
+        # one dict lookup instead of walking an if/elif chain of string
+        # compares. create_entity stays out of the table - it is special-cased
+        # in flush for run batching.
+        entities = world.entities
+        self._dispatch = {
+            "remove_entity": entities.remove,
+            "remove_entities": self._apply_removals,
+            "create_entities": self._apply_bulk_create,
+            "add_components": entities.add_components,
+            "remove_components": entities.remove_components,
+        }
+
+    def _apply_removals(self, entity_ids):
+        remove = self.world.entities.remove
+        for entity_id in entity_ids:
+            remove(entity_id)
+
+    def _apply_bulk_create(self, components_data, ids):
+        self.world.entities.add_many(components_data, len(ids), ids=ids)
+
+    def _queues(self) -> tuple[list, list]:
+        """The (commands, reserved_ids) lists the calling thread queues into
+
+        The shared lists, unless the thread is inside `run_staged` - then
+        its private staging lists.
+        """
+        staged = getattr(self._staging, "queues", None)
+        return (self._commands, self._reserved_ids) if staged is None else staged
+
+    def run_staged(self, fn, *args):
+        """Run `fn` with its queued commands staged thread-locally
+
+        Used by the parallel scheduler: the systems of a wave share this
+        buffer from worker threads, so each system queues into a private
+        staging area that is merged into the shared queues only if it
+        returns cleanly. A failing system's commands are dropped without
+        touching what its siblings queued; the ids it reserved are still
+        merged so the post-wave flush releases them.
+        """
+        staged = ([], [])
+        self._staging.queues = staged
+        try:
+            fn(*args)
+        except Exception:
+            self._reserved_ids.extend(staged[1])
+            raise
+        else:
+            # list.extend is atomic under the GIL, so sibling systems can
+            # merge concurrently without a lock
+            self._commands.extend(staged[0])
+            self._reserved_ids.extend(staged[1])
+        finally:
+            self._staging.queues = None
 
     def create_entity(self, components_data: dict[Type[Component], Any]):
         """Create a new entity with initial data"""
         entity_id = self.world.reserve_id()
-        self._commands.append(("create_entity", components_data, entity_id))
-        self._reserved_ids.append(entity_id)
+        commands, reserved_ids = self._queues()
+        commands.append(("create_entity", components_data, entity_id))
+        reserved_ids.append(entity_id)
         return entity_id
 
+    def create_entities(self, components_data: dict[Type[Component], Any], n: int):
+        """Queue a bulk entity creation from columnar component data
+
+        The whole batch is reserved with one vectorized call and queued as
+        a single command, so the per-entity reserve/append round-trips of
+        `create_entity` disappear. On flush the batch lands through
+        `EntityManager.add_many` - one copy per component column.
+
+        Args:
+            components_data: dictionary of {type: batch_array}, as accepted
+                by `World.create_entities`
+            n: number of entities to create
+        Returns:
+            np.ndarray: the reserved ids of the entities to be created
+        """
+        ids = self.world.entities.reserve_ids(n)
+        commands, reserved_ids = self._queues()
+        commands.append(("create_entities", components_data, ids))
+        reserved_ids.extend(ids.tolist())
+        return ids
+
     def remove_entity(self, entity_id):
         """Remove an entity from the world"""
-        self._commands.append(("remove_entity", entity_id))
+        self._queues()[0].append(("remove_entity", entity_id))
+
+    def remove_entities(self, entity_ids):
+        """Remove a batch of entities from the world
+
+        Queues the whole batch as a single command, avoiding a Python call
+        per entity at the call site.
+        """
+        self._queues()[0].append(("remove_entities", entity_ids))
 
     def add_components(self, entity_id, components_data: dict[Type[Component], Any]):
         """Add components to an entity"""
-        self._commands.append(("add_components", entity_id, components_data))
+        self._queues()[0].append(("add_components", entity_id, components_data))
 
     def remove_components(self, entity_id, components: list[Type[Component]]):
         """Remove components from an entity"""
-        self._commands.append(("remove_components", entity_id, components))
+        self._queues()[0].append(("remove_components", entity_id, components))
 
     def flush(self):
-        # TODO - group operations
+        """Execute the queued commands in order
+
+        Contiguous runs of `create_entity` commands that share a component
+        composition are dispatched as a single batch, so the archetype is
+        resolved once per run instead of once per entity.
+        """
+        # flush runs after every system every frame; most of those calls find
+        # nothing queued, so bail before the try/finally + clear machinery
+        if not self._commands and not self._reserved_ids:
+            return
         try:
-            for cmd, *args in self._commands:
+            commands = self._commands
+            entities = self.world.entities
+            dispatch = self._dispatch
+            n = len(commands)
+            i = 0
+            while i < n:
+                command = commands[i]
+                cmd = command[0]
                 if cmd == "create_entity":
-                    self.world.entities.add(*args)
-                elif cmd == "remove_entity":
-                    self.world.entities.remove(*args)
-                elif cmd == "add_components":
-                    self.world.entities.add_components(*args)
-                elif cmd == "remove_components":
-                    self.world.entities.remove_components(*args)
+                    key = tuple(command[1])
+                    j = i + 1
+                    while (
+                        j < n
+                        and commands[j][0] == "create_entity"
+                        and tuple(commands[j][1]) == key
+                    ):
+                        j += 1
+                    if j - i > 1:
+                        entities.add_run(
+                            [c[1] for c in commands[i:j]],
+                            [c[2] for c in commands[i:j]],
+                        )
+                    else:
+                        entities.add(command[1], command[2])
+                    i = j
+                    continue
+                dispatch[cmd](*command[1:])
+                i += 1
         finally:
             self.clear()
 
@@ -26,8 +26,13 @@ class Component(ABC):
         >>>     dtype = np.int32
     """
 
+    __slots__ = ()
+
     shape: tuple[int, ...] = (1,)
     dtype: Union[np.dtype, type[np.generic]] = np.float32
+    # tag-ness is a class-level property; hot paths read this flag instead
+    # of paying an issubclass MRO walk per check
+    _is_tag: bool = False
 
 
 class TagComponent(Component, ABC):
@@ -51,8 +56,11 @@ class TagComponent(Component, ABC):
         >>>     pass
     """
 
+    __slots__ = ()
+
     shape = None
     dtype = None
+    _is_tag = True
 
 
 class ComponentRegistry:
@@ -61,7 +69,8 @@ class ComponentRegistry:
         """Assign unique bits to components and generate signatures"""
         self._component_bits: dict[Type[Component], int] = {}
         self._next_bit = 1
-        self._cache: dict[frozenset[Type[Component]], int] = {}
+        self._cache: dict[tuple[Type[Component], ...], int] = {}
+        self._sort_cache: dict[tuple[Type[Component], ...], list[Type[Component]]] = {}
 
     def get_bit(self, comp_type: Type[Component]) -> int:
         """Get component bit, assign one if it doesn't have one"""
@@ -87,21 +96,32 @@ class ComponentRegistry:
             an integer that represents the signature of this component composition.
             Each component affects a unique bit in that signature.
         """
-        components = self.sort_components(components)
-        cache_key = frozenset(components)
-        if cache_key in self._cache:
-            return self._cache[cache_key]
-        signature = 0
-        for comp_type in components:
-            signature |= self.get_bit(comp_type)
-
-        self._cache[cache_key] = signature
+        # the cache is keyed on the input tuple as-is - a repeated ordering of
+        # the same components (the common case for hot call sites) hits the
+        # cache without paying for a frozenset build or a sort. Different
+        # orderings of one composition cost an extra cache entry, not an
+        # extra signature.
+        cache_key = tuple(components)
+        signature = self._cache.get(cache_key)
+        if signature is None:
+            signature = 0
+            for comp_type in components:
+                signature |= self.get_bit(comp_type)
+            self._cache[cache_key] = signature
         return signature
 
     def sort_components(
         self, components: list[Type[Component]]
     ) -> list[Type[Component]]:
-        """Sort components according to their associated bit and de-duplicate"""
+        """Sort components according to their associated bit and de-duplicate
+
+        Results are memoized per input ordering, so repeated calls with the
+        same component list skip the set build and the sort entirely.
+        """
         # TODO - may be redundant now (archetype stores components as sets)
-        components = set(components)
-        return sorted(components, key=lambda x: self.get_bit(x))
+        cache_key = tuple(components)
+        cached = self._sort_cache.get(cache_key)
+        if cached is None:
+            cached = sorted(set(components), key=self.get_bit)
+            self._sort_cache[cache_key] = cached
+        return list(cached)
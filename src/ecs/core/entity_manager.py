@@ -1,17 +1,80 @@
-from typing import Any, Callable, Optional, Type
+import threading
+from typing import Any, Callable, Iterator, Optional, Type
 
 import numpy as np
 
 from .archetype import Archetype
 from .component import Component, ComponentRegistry, TagComponent
 
+# sentinel values stored in the sparse archetype-index array
+_DEAD = -1
+_RESERVED = -2
+
 
 class PendingEntityException(Exception):
     pass
 
 
+class EntityIndex:
+    """Dict-like view over the EntityManager's sparse entity index
+
+    Exposes the `entity_id -> (archetype, row)` mapping with the same
+    interface as the dict it replaced, while the underlying storage is a
+    pair of dense int64 arrays indexed directly by entity id.
+    """
+
+    __slots__ = ("_manager",)
+
+    def __init__(self, manager: "EntityManager"):
+        self._manager = manager
+
+    def __contains__(self, entity_id: int) -> bool:
+        m = self._manager
+        return 0 <= entity_id < m.next_id and m.arch_idx[entity_id] != _DEAD
+
+    def __getitem__(self, entity_id: int) -> tuple[Optional[Archetype], Optional[int]]:
+        m = self._manager
+        if not (0 <= entity_id < m.next_id):
+            raise KeyError(entity_id)
+        arch_i = m.arch_idx[entity_id]
+        if arch_i == _DEAD:
+            raise KeyError(entity_id)
+        if arch_i == _RESERVED:
+            return None, None
+        return m.archetypes_by_idx[arch_i], int(m.row_idx[entity_id])
+
+    def __len__(self) -> int:
+        return self._manager.count
+
+    def __iter__(self) -> Iterator[int]:
+        alive = self._manager.arch_idx[: self._manager.next_id] != _DEAD
+        return iter(np.flatnonzero(alive).tolist())
+
+
 class EntityManager:
 
+    __slots__ = (
+        "next_id",
+        "count",
+        "_index_capacity",
+        "arch_idx",
+        "row_idx",
+        "_free_ids",
+        "_free_top",
+        "_generations",
+        "archetypes_by_idx",
+        "entities_map",
+        "archetypes",
+        "_archetype_cache",
+        "registry",
+        "on_arch_created",
+        "_migration_cache",
+        "_validators",
+        "_id_lock",
+    )
+
+    INITIAL_INDEX_CAPACITY = 256
+
     def __init__(
         self,
         component_registry: ComponentRegistry,
@@ -23,6 +86,11 @@ class EntityManager:
         as well as managing their components and associating them with
         specific Archetypes.
 
+        Entity liveness and location are stored in a sparse set: two dense
+        int64 arrays (`arch_idx`, `row_idx`) indexed by entity id, so hot
+        lookups are a single indexed load instead of a dict lookup. The
+        dict-like `entities_map` view is kept for external consumers.
+
         Args:
             component_registry (ComponentRegistry): component registry for archetype
                 signature calculation and quick lookup
@@ -31,16 +99,45 @@ class EntityManager:
                 queries.
         """
         self.next_id = 0
-        self.entities_map: dict[int, tuple[Optional[Archetype], Optional[int]]] = {}
+        self.count = 0
+        self._index_capacity = self.INITIAL_INDEX_CAPACITY
+        self.arch_idx = np.full(self._index_capacity, _DEAD, dtype=np.int64)
+        self.row_idx = np.full(self._index_capacity, -1, dtype=np.int64)
+        # freed ids are recycled through a numpy-backed stack; generations
+        # count how many times an id has been reused so stale references can
+        # be told apart from the current holder of the id
+        self._free_ids = np.empty(self._index_capacity, dtype=np.int64)
+        self._free_top = 0
+        self._generations = np.zeros(self._index_capacity, dtype=np.uint16)
+        self.archetypes_by_idx: list[Archetype] = []
+        self.entities_map = EntityIndex(self)
         self.archetypes: dict[int, Archetype] = {}
+        # component tuple -> archetype, keyed on the input ordering like the
+        # registry's signature cache - repeated call sites resolve their
+        # archetype with a single dict probe
+        self._archetype_cache: dict[tuple[Type[Component], ...], Archetype] = {}
         self.registry = component_registry
         self.on_arch_created = on_arch_created
+        # (src signature, dst signature) -> list of (src_array, dst_array)
+        # storage pairs shared by the two archetypes. Cached per transition so
+        # migrations skip the per-component dict lookups.
+        self._migration_cache: dict[
+            tuple[int, int], list[tuple[np.ndarray, np.ndarray]]
+        ] = {}
+        # comp_type -> validator closure, built lazily per component type so
+        # the per-call schema checks are specialized once instead of being
+        # re-derived from class attributes on every store
+        self._validators: dict[Type[Component], Callable[[Any], Any]] = {}
+        # serializes id reservation: systems running in the same parallel
+        # wave share the world's CommandBuffer, and its create paths reserve
+        # ids immediately. The scheduler's read/write-set conflict check does
+        # not cover command-buffer use, so without this lock two wave-parallel
+        # systems could be handed the same id. The single-threaded create
+        # paths (add/add_many) mint ids outside the lock and stay unaffected.
+        self._id_lock = threading.Lock()
 
     @staticmethod
     def _validate_array(comp_type: Type[Component], value: Any) -> np.ndarray:
-        if not __debug__:
-            return value
-
         if (comp_type.shape != (1,) and value.shape != comp_type.shape) or (
             comp_type.shape == (1,) and value.shape not in [(1,), ()]
         ):
@@ -56,36 +153,141 @@ class EntityManager:
             )
         return value
 
-    def _validate_data(self, comp_type: Type[Component], value: Any):
-        """Perform validation of data against component schema."""
+    @staticmethod
+    def _build_validator(comp_type: Type[Component]) -> Callable[[Any], Any]:
+        """Build a validator closure specialized for one component type
+
+        The closure captures the component schema once, so per-call work is
+        limited to the checks that actually depend on the value. Scalar
+        components take a fast path for plain python numbers whose kind casts
+        losslessly, skipping the shape and can_cast re-checks.
+        """
         if issubclass(comp_type, TagComponent):
             # skip value validation for tag components
-            return None
-        elif isinstance(value, np.ndarray):
-            return self._validate_array(comp_type, value)
-        if comp_type.shape == ():
-            arr = np.array(value, dtype=comp_type.dtype)
-            return self._validate_array(comp_type, arr)
-        if len(comp_type.shape) == 1:
-            arr = np.array(value, dtype=comp_type.dtype, ndmin=1)
-            return self._validate_array(comp_type, arr)
-        raise ValueError(
-            f"{comp_type.__name__} is multi-dimensional {comp_type.shape} "
-            f"and does not support auto-casting to numpy arrays."
-        )
+            return lambda value: None
+
+        if not __debug__:
+            # release builds (-O) skip validation entirely - the flag is
+            # checked once here instead of on every store, and numpy
+            # broadcasting handles the conversion at assignment time
+            return lambda value: value
+
+        shape = comp_type.shape
+        dtype = np.dtype(comp_type.dtype)
+        validate_array = EntityManager._validate_array
+
+        if shape == (1,):
+            kind = dtype.kind
+
+            def validate(value: Any):
+                vtype = type(value)
+                if (vtype is float and kind == "f") or (vtype is int and kind in "fiu"):
+                    # the constructed array is valid by construction - skip
+                    # the shape/dtype re-checks
+                    return np.array(value, dtype=dtype, ndmin=1)
+                if isinstance(value, np.ndarray):
+                    return validate_array(comp_type, value)
+                return validate_array(comp_type, np.array(value, dtype=dtype, ndmin=1))
+
+            return validate
+
+        if shape == () or len(shape) == 1:
+            ndmin = 0 if shape == () else 1
+
+            def validate(value: Any):
+                if isinstance(value, np.ndarray):
+                    return validate_array(comp_type, value)
+                return validate_array(
+                    comp_type, np.array(value, dtype=dtype, ndmin=ndmin)
+                )
+
+            return validate
+
+        def validate(value: Any):
+            if isinstance(value, np.ndarray):
+                return validate_array(comp_type, value)
+            raise ValueError(
+                f"{comp_type.__name__} is multi-dimensional {shape} "
+                f"and does not support auto-casting to numpy arrays."
+            )
+
+        return validate
+
+    def _validate_data(self, comp_type: Type[Component], value: Any):
+        """Perform validation of data against component schema."""
+        validator = self._validators.get(comp_type)
+        if validator is None:
+            validator = self._build_validator(comp_type)
+            self._validators[comp_type] = validator
+        return validator(value)
+
+    def _grow_index(self, required: int):
+        """Grow the sparse index arrays geometrically to fit `required` ids"""
+        old_capacity = self._index_capacity
+        capacity = old_capacity
+        while capacity < required:
+            capacity *= 2
+        self.arch_idx.resize(capacity, refcheck=False)
+        self.arch_idx[old_capacity:] = _DEAD
+        self.row_idx.resize(capacity, refcheck=False)
+        self.row_idx[old_capacity:] = -1
+        self._generations.resize(capacity, refcheck=False)
+        self._index_capacity = capacity
 
     def _assign_id(self):
-        """Assign unique entity id"""
+        """Assign an entity id, recycling freed ids before minting new ones
+
+        New ids grow the index arrays geometrically when exhausted.
+        """
+        if self._free_top:
+            self._free_top -= 1
+            return int(self._free_ids[self._free_top])
         ret = self.next_id
+        if ret >= self._index_capacity:
+            self._grow_index(ret + 1)
         self.next_id += 1
         return ret
 
+    def _mint_ids(self, n: int) -> np.ndarray:
+        """Assign a batch of entity ids, draining the free-list first"""
+        ids = np.empty(n, dtype=np.int64)
+        take = min(self._free_top, n)
+        if take:
+            self._free_top -= take
+            top = self._free_top
+            end = top + take
+            # reversed so the batch pops in the same LIFO order as _assign_id
+            ids[:take] = self._free_ids[top:end][::-1]
+        fresh = n - take
+        if fresh:
+            start = self.next_id
+            if start + fresh > self._index_capacity:
+                self._grow_index(start + fresh)
+            ids[take:] = np.arange(start, start + fresh, dtype=np.int64)
+            self.next_id += fresh
+        return ids
+
+    def _free_id(self, entity_id: int):
+        """Push a dead id onto the recycle stack and bump its generation"""
+        if self._free_top >= self._free_ids.shape[0]:
+            self._free_ids.resize(self._free_ids.shape[0] * 2, refcheck=False)
+        self._free_ids[self._free_top] = entity_id
+        self._free_top += 1
+        self._generations[entity_id] += 1
+
+    def _is_dead(self, entity_id: int) -> bool:
+        return (
+            entity_id < 0
+            or entity_id >= self.next_id
+            or self.arch_idx[entity_id] == _DEAD
+        )
+
     def _remove_and_swap(self, arch: Archetype, row: int):
         """Remove entity from archetype by row
 
         After the removal, the archetype fills the empty row with
         a different entity id to maintain density, so the function
-        also updates the row in the entities_map.
+        also updates the row in the entity index.
 
         Args:
             arch (Archetype): the archetype to remove the entity from
@@ -93,7 +295,27 @@ class EntityManager:
         """
         swapped = arch.remove_entity(row)
         if swapped != -1:
-            self.entities_map[swapped] = (arch, row)
+            self.row_idx[swapped] = row
+
+    def _migration_pairs(
+        self, prev_arch: Archetype, new_arch: Archetype
+    ) -> list[tuple[np.ndarray, np.ndarray]]:
+        """Get the (src_array, dst_array) storage pairs shared by two archetypes
+
+        The pairs are computed once per transition and cached. This is safe
+        because archetype storage arrays are resized in place, so the array
+        objects stay valid for the lifetime of the archetype.
+        """
+        key = (prev_arch.signature, new_arch.signature)
+        pairs = self._migration_cache.get(key)
+        if pairs is None:
+            pairs = [
+                (src, new_arch.storage[comp_type])
+                for comp_type, src in prev_arch.storage.items()
+                if comp_type in new_arch.storage
+            ]
+            self._migration_cache[key] = pairs
+        return pairs
 
     def get_archetype(self, components: list[Type[Component]]) -> Archetype:
         """Get archetype for a given component composition
@@ -106,24 +328,58 @@ class EntityManager:
         Returns:
             archetype (Archetype): an archetype that matches the component composition
         """
+        key = tuple(components)
+        arch = self._archetype_cache.get(key)
+        if arch is not None:
+            return arch
         sig = self.registry.get_signature(components)
-        if sig not in self.archetypes:
-            new_arch = Archetype(components, sig)
-            self.on_arch_created(new_arch)
-            self.archetypes[sig] = new_arch
-        return self.archetypes[sig]
+        arch = self.archetypes.get(sig)
+        if arch is None:
+            arch = Archetype(components, sig)
+            arch.index = len(self.archetypes_by_idx)
+            self.archetypes_by_idx.append(arch)
+            self.on_arch_created(arch)
+            self.archetypes[sig] = arch
+        self._archetype_cache[key] = arch
+        return arch
 
     def reserve_id(self):
-        """Reserve an id for an entity without creating it"""
-        eid = self._assign_id()
-        self.entities_map[eid] = (None, None)
+        """Reserve an id for an entity without creating it
+
+        Reservation is the only id-allocation path reachable from
+        wave-parallel systems (through the CommandBuffer), so it is
+        serialized with a lock.
+        """
+        with self._id_lock:
+            eid = self._assign_id()
+            self.arch_idx[eid] = _RESERVED
+            self.count += 1
         return eid
 
+    def reserve_ids(self, n: int) -> np.ndarray:
+        """Reserve a batch of ids without creating the entities
+
+        The bulk counterpart of `reserve_id`: ids are minted in one array
+        operation and marked reserved with a single indexed store. Like
+        `reserve_id`, the allocation is serialized for wave-parallel callers.
+
+        Args:
+            n: number of ids to reserve
+        Returns:
+            np.ndarray: the reserved ids, one per row
+        """
+        with self._id_lock:
+            ids = self._mint_ids(n)
+            self.arch_idx[ids] = _RESERVED
+            self.count += n
+        return ids
+
     def deregister_reserved_ids(self, ids: list[int]):
         for eid in ids:
-            if eid not in self.entities_map or self.entities_map[eid] != (None, None):
-                continue
-            self.entities_map.pop(eid, None)
+            if 0 <= eid < self.next_id and self.arch_idx[eid] == _RESERVED:
+                self.arch_idx[eid] = _DEAD
+                self.count -= 1
+                self._free_id(eid)
 
     def add(
         self,
@@ -138,30 +394,141 @@ class EntityManager:
         For tag components only the keys in component_data are used, and the values
         are ignored.
         """
+        validate = self._validate_data
         converted_data = {
-            comp_type: self._validate_data(comp_type, value)
+            comp_type: validate(comp_type, value)
             for comp_type, value in components_data.items()
         }
         if reserved_id is not None:
-            if reserved_id not in self.entities_map:
+            if self._is_dead(reserved_id):
                 raise ValueError(f"entity_id {reserved_id} was not reserved")
-            elif self.entities_map[reserved_id][0] is not None:
+            elif self.arch_idx[reserved_id] != _RESERVED:
                 raise ValueError(f"entity_id {reserved_id} already exists")
         comp_types = list(converted_data.keys())
         archetype = self.get_archetype(comp_types)
-        eid = reserved_id if reserved_id is not None else self._assign_id()
+        if reserved_id is not None:
+            eid = reserved_id
+        else:
+            eid = self._assign_id()
+            self.count += 1
         row = archetype.allocate(eid)
+        end = row + 1
+        # tag components have no storage column - storage.get doubles as the
+        # tag check, avoiding an issubclass call per store
+        storage = archetype.storage
         for comp_type, value in converted_data.items():
-            if issubclass(comp_type, TagComponent):
-                continue
-            archetype.storage[comp_type][row] = value
-        self.entities_map[eid] = (archetype, row)
+            column = storage.get(comp_type)
+            if column is not None:
+                # slice assignment broadcasts (1,)-shaped values into the
+                # flat scalar columns as well as N-D rows
+                column[row:end] = value
+        self.arch_idx[eid] = archetype.index
+        self.row_idx[eid] = row
         return eid
 
+    def add_run(
+        self,
+        batch_data: list[dict[Type[Component], Any]],
+        reserved_ids: list[int],
+    ):
+        """Create a batch of entities that share one component composition
+
+        The archetype and its storage arrays are resolved once for the whole
+        batch, so per-entity cost is reduced to the row allocation and the
+        component stores. All ids must already be reserved (this is the
+        CommandBuffer's bulk creation path).
+
+        Args:
+            batch_data: one components_data dict per entity, all with the
+                same component composition
+            reserved_ids: the reserved entity id for each dict in batch_data
+        """
+        comp_types = list(batch_data[0].keys())
+        archetype = self.get_archetype(comp_types)
+        archetype.reserve(len(reserved_ids))
+        arch_index = archetype.index
+        data_columns = [
+            (comp_type, archetype.storage[comp_type])
+            for comp_type in comp_types
+            if comp_type in archetype.storage
+        ]
+        # hoist per-entity attribute lookups out of the loop
+        allocate = archetype.allocate
+        validate = self._validate_data
+        arch_idx = self.arch_idx
+        row_idx = self.row_idx
+        for eid, data in zip(reserved_ids, batch_data):
+            row = allocate(eid)
+            end = row + 1
+            for comp_type, column in data_columns:
+                column[row:end] = validate(comp_type, data[comp_type])
+            arch_idx[eid] = arch_index
+            row_idx[eid] = row
+
+    def add_many(
+        self,
+        components_data: dict[Type[Component], Any],
+        n: int,
+        ids: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Create a batch of entities from columnar component data
+
+        Unlike `add_run`, which takes one data dict per entity, this path
+        takes one array per component holding the values for all n entities
+        and stores each column with a single slice assignment - one
+        vectorized copy per component instead of n scalar stores.
+
+        Args:
+            components_data: dictionary of {type: batch_array} where each
+                array holds the values for all n entities - shape
+                (n, *component shape), or (n,) for scalar components.
+                for TagComponents, the value is ignored.
+            n: number of entities to create
+            ids: optional batch of already-reserved ids to use instead of
+                minting fresh ones (the CommandBuffer's bulk creation path).
+                The entity count was bumped at reservation time.
+        Returns:
+            np.ndarray: the ids of the created entities, one per row
+        """
+        converted: dict[Type[Component], Optional[np.ndarray]] = {}
+        for comp_type, value in components_data.items():
+            if comp_type._is_tag:
+                converted[comp_type] = None
+                continue
+            arr = np.asarray(value)
+            expected = (n,) if comp_type.shape == (1,) else (n, *comp_type.shape)
+            if expected == (n,) and arr.shape == (n, 1):
+                arr = arr.reshape(n)
+            if arr.shape != expected:
+                raise ValueError(
+                    f"Component {comp_type.__name__} expects batch shape "
+                    f"{expected}, but got {arr.shape}."
+                )
+            if not np.can_cast(arr.dtype, comp_type.dtype, casting="same_kind"):
+                raise TypeError(
+                    f"Component {comp_type.__name__} expects dtype "
+                    f"{comp_type.dtype}, but got incompatible dtype {arr.dtype}."
+                )
+            converted[comp_type] = arr
+
+        archetype = self.get_archetype(list(components_data.keys()))
+        if ids is None:
+            ids = self._mint_ids(n)
+            self.count += n
+        row0 = archetype.allocate_n(ids)
+        row1 = row0 + n
+        storage = archetype.storage
+        for comp_type, arr in converted.items():
+            if arr is not None:
+                storage[comp_type][row0:row1] = arr
+        self.arch_idx[ids] = archetype.index
+        self.row_idx[ids] = np.arange(row0, row1, dtype=np.int64)
+        return ids
+
     def remove(self, entity_id: int) -> int:
         """Remove an entity
 
-        Remove the entity from its archetype and from the entities_map.
+        Remove the entity from its archetype and from the entity index.
         if the entity doesn't exist - raise an exception.
 
         Args:
@@ -169,12 +536,16 @@ class EntityManager:
         Returns:
             entity_id (int): the removed entity
         """
-        if entity_id not in self.entities_map:
+        if self._is_dead(entity_id):
             raise ValueError(f"entity_id {entity_id} does not exist")
-        arch, row = self.entities_map.pop(entity_id)
-        if arch is None:  # entity was reserved but never created
+        arch_i = self.arch_idx[entity_id]
+        self.arch_idx[entity_id] = _DEAD
+        self.count -= 1
+        self._free_id(entity_id)
+        if arch_i == _RESERVED:  # entity was reserved but never created
             return entity_id
-        self._remove_and_swap(arch, row)
+        arch = self.archetypes_by_idx[arch_i]
+        self._remove_and_swap(arch, int(self.row_idx[entity_id]))
         return entity_id
 
     def add_components(
@@ -209,42 +580,58 @@ class EntityManager:
                 component schema.
                 for TagComponents, the value is ignored.
         """
-        if entity_id not in self.entities_map:
+        if self._is_dead(entity_id):
             raise ValueError(f"entity_id {entity_id} does not exist")
 
+        validate = self._validate_data
         converted_data = {
-            comp_type: self._validate_data(comp_type, value)
+            comp_type: validate(comp_type, value)
             for comp_type, value in components_data.items()
         }
 
-        prev_arch, prev_row = self.entities_map[entity_id]
-
-        if prev_arch is None:  # entity was reserved but never created
+        arch_i = self.arch_idx[entity_id]
+        if arch_i == _RESERVED:  # entity was reserved but never created
             raise RuntimeError("Attempted to structurally modify a pending entity")
-
-        types = list(prev_arch.components)
-        for comp_type in converted_data:
-            if comp_type not in types:
-                types.append(comp_type)
-
-        new_arch = self.get_archetype(types)
-        if new_arch == prev_arch:
+        prev_arch = self.archetypes_by_idx[arch_i]
+        prev_row = int(self.row_idx[entity_id])
+
+        # "update existing" fast path: if every component is already part of
+        # the archetype there is no structural change, so skip the edge
+        # lookup / archetype resolution entirely and just store the values
+        prev_components = prev_arch.components
+        if all(ct in prev_components for ct in converted_data):
+            storage = prev_arch.storage
+            prev_end = prev_row + 1
             for comp_type, value in converted_data.items():
-                if issubclass(comp_type, TagComponent):
-                    continue
-                new_arch.storage[comp_type][prev_row] = value
+                column = storage.get(comp_type)
+                if column is not None:
+                    column[prev_row:prev_end] = value
             return
 
+        edge_key = frozenset(converted_data)
+        new_arch = prev_arch.add_edges.get(edge_key)
+        if new_arch is None:
+            types = list(prev_arch.components)
+            for comp_type in converted_data:
+                if comp_type not in types:
+                    types.append(comp_type)
+            new_arch = self.get_archetype(types)
+            prev_arch.add_edges[edge_key] = new_arch
+        storage = new_arch.storage
+
         new_row = new_arch.allocate(entity_id)
-        for comp_type, prev_data in prev_arch.storage.items():
-            new_arch.storage[comp_type][new_row] = prev_data[prev_row]
+        new_end = new_row + 1
+        prev_end = prev_row + 1
+        for src, dst in self._migration_pairs(prev_arch, new_arch):
+            dst[new_row:new_end] = src[prev_row:prev_end]
         self._remove_and_swap(prev_arch, prev_row)
 
         for comp_type, value in converted_data.items():
-            if issubclass(comp_type, TagComponent):
-                continue
-            new_arch.storage[comp_type][new_row] = value
-        self.entities_map[entity_id] = (new_arch, new_row)
+            column = storage.get(comp_type)
+            if column is not None:
+                column[new_row:new_end] = value
+        self.arch_idx[entity_id] = new_arch.index
+        self.row_idx[entity_id] = new_row
 
     def remove_components(self, entity_id: int, components: list[Type[Component]]):
         """Remove components from an existing entity
@@ -259,29 +646,36 @@ class EntityManager:
             is therefore relatively inefficient. see docstring in
             `EntityManager.add_components` for more information and best practices.
         """
-        if entity_id not in self.entities_map:
+        if self._is_dead(entity_id):
             raise ValueError(f"entity_id {entity_id} does not exist")
 
-        prev_arch, prev_row = self.entities_map[entity_id]
-
-        if prev_arch is None:  # entity was reserved but never created
+        arch_i = self.arch_idx[entity_id]
+        if arch_i == _RESERVED:  # entity was reserved but never created
             raise RuntimeError("Attempted to structurally modify a pending entity")
+        prev_arch = self.archetypes_by_idx[arch_i]
+        prev_row = int(self.row_idx[entity_id])
 
-        to_remove = set(components)
-        types = [c for c in prev_arch.components if c not in to_remove]
-
-        new_arch = self.get_archetype(types)
-        if new_arch == prev_arch:
+        # no-op fast path: if none of the components are present, the
+        # archetype would not change - skip the edge lookup entirely
+        if prev_arch.components.isdisjoint(components):
             return
 
+        edge_key = frozenset(components)
+        new_arch = prev_arch.remove_edges.get(edge_key)
+        if new_arch is None:
+            types = [c for c in prev_arch.components if c not in edge_key]
+            new_arch = self.get_archetype(types)
+            prev_arch.remove_edges[edge_key] = new_arch
+
         new_row = new_arch.allocate(entity_id)
-        for comp_type, data in new_arch.storage.items():
-            if issubclass(comp_type, TagComponent):
-                continue
-            data[new_row] = prev_arch.storage[comp_type][prev_row]
+        new_end = new_row + 1
+        prev_end = prev_row + 1
+        for src, dst in self._migration_pairs(prev_arch, new_arch):
+            dst[new_row:new_end] = src[prev_row:prev_end]
 
         self._remove_and_swap(prev_arch, prev_row)
-        self.entities_map[entity_id] = (new_arch, new_row)
+        self.arch_idx[entity_id] = new_arch.index
+        self.row_idx[entity_id] = new_row
 
     def get_component(self, entity_id: int, comp_type: Type[Component]) -> Any:
         """Get the value of a specific component of an entity
@@ -298,21 +692,22 @@ class EntityManager:
             ValueError: if the entity doesn't exist or doesn't have the component
             PendingEntityException: if the entity is pending
         """
-        if entity_id not in self.entities_map:
+        if self._is_dead(entity_id):
             raise ValueError(f"entity_id {entity_id} does not exist")
 
-        arch, row = self.entities_map[entity_id]
-
-        if arch is None:  # entity was reserved but never created
+        arch_i = self.arch_idx[entity_id]
+        if arch_i == _RESERVED:  # entity was reserved but never created
             raise PendingEntityException(f"entity_id {entity_id} is still pending")
+        arch = self.archetypes_by_idx[arch_i]
 
-        if comp_type not in arch.components:
+        column = arch.storage.get(comp_type)
+        if column is None:
+            if comp_type in arch.components:  # tag component - no data
+                return None
             raise ValueError(
                 f"entity {entity_id} does not have component {comp_type.__name__}"
             )
-        if issubclass(comp_type, TagComponent):
-            return None
-        return arch.storage[comp_type][row]
+        return column[self.row_idx[entity_id]]
 
     def set_component(self, entity_id: int, comp_type: Type[Component], value: Any):
         """Set the value for a specific component of an entity
@@ -334,19 +729,22 @@ class EntityManager:
             PendingEntityException: if the entity is pending
 
         """
-        if entity_id not in self.entities_map:
+        if self._is_dead(entity_id):
             raise ValueError(f"entity_id {entity_id} does not exist")
         value = self._validate_data(comp_type, value)
-        arch, row = self.entities_map[entity_id]
+        arch_i = self.arch_idx[entity_id]
 
-        if arch is None:  # entity was reserved but never created
+        if arch_i == _RESERVED:  # entity was reserved but never created
             raise PendingEntityException(f"entity_id {entity_id} is still pending")
+        arch = self.archetypes_by_idx[arch_i]
 
-        if comp_type not in arch.components:
+        column = arch.storage.get(comp_type)
+        if column is None:
+            if comp_type in arch.components:  # tag component - no data
+                return
             raise ValueError(
                 f"entity {entity_id} does not have component {comp_type.__name__}"
             )
-
-        if issubclass(comp_type, TagComponent):
-            return
-        arch.storage[comp_type][row] = value
+        row = self.row_idx[entity_id]
+        end = row + 1
+        column[row:end] = value
@@ -1,3 +1,4 @@
+from itertools import count
 from typing import Callable, Dict, List, Optional, Type, TypeVar
 from weakref import WeakMethod, ref
 
@@ -5,9 +6,22 @@ from .command_buffer import CommandBuffer
 
 
 class Event:
-    """Base class for events."""
+    """Base class for events.
 
-    pass
+    Every subclass is assigned a small sequential integer id at class
+    definition time. The ids are global (shared by all buses), so each bus
+    can index its subscriber table by id instead of hashing the class.
+    """
+
+    _event_id: int = -1
+    _next_event_id = count()
+    # type tag read by the publish hot paths - one attribute load instead
+    # of an isinstance call per published event
+    _is_event: bool = True
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._event_id = next(Event._next_event_id)
 
 
 _T = TypeVar("_T", bound=Event)
@@ -29,13 +43,20 @@ class EventBus:
     """
 
     def __init__(self, cmd_buffer: CommandBuffer):
-        self._subscribers: Dict[Type[_T], List[WeakCallable]] = {}
-        # Two buffers for asynchronous events.
-        self._current_async_queue: List[_T] = []
-        self._next_async_queue: List[_T] = []
+        # handlers are stored per event type id in a list indexed by the
+        # type's integer id, as a dict keyed by subscription id - publish is
+        # a list index instead of a class hash, and dead-ref cleanup is an
+        # O(1) dict deletion instead of an O(n) list.remove scan
+        self._subscribers: List[Optional[Dict[int, WeakCallable]]] = []
+        self._sub_ids = count()
+        # Two buffers for asynchronous events, bucketed by event type id so
+        # dispatch resolves each subscriber dict once per type per frame
+        # instead of once per event.
+        self._current_async_queue: Dict[int, List[_T]] = {}
+        self._next_async_queue: Dict[int, List[_T]] = {}
         self.cmd_buffer = cmd_buffer
 
-    def subscribe(self, event_type: Type[_T], handler: Callable[[_T], None]) -> None:
+    def subscribe(self, event_type: Type[_T], handler: Callable[[_T], None]) -> int:
         """Subscribe a handler to a specific event type.
 
         Whenever an event of that type is dispatched, all subscribers will be called
@@ -46,26 +67,34 @@ class EventBus:
             handler (Callable[[Event], None]): The function to call when the event is
                 published.
 
+        Returns:
+            the subscription id of the handler.
+
         Notes:
             The handler is stored as a weak reference. This means that the original
             reference has to be active for it to be called.
             This also means that this feature does not work with `lambda` functions.
         """
-        if event_type not in self._subscribers:
-            self._subscribers[event_type] = []
+        tid = event_type._event_id
+        if tid < 0:
+            raise TypeError(f"{event_type} is not a subclass of Event")
+        while len(self._subscribers) <= tid:
+            self._subscribers.append(None)
+        handlers = self._subscribers[tid]
+        if handlers is None:
+            handlers = self._subscribers[tid] = {}
+        sub_id = next(self._sub_ids)
 
         # Callback to remove dead references.
         def _remove(_weak_handler) -> None:
-            try:
-                self._subscribers[event_type].remove(_weak_handler)
-            except ValueError:
-                pass
+            handlers.pop(sub_id, None)
 
         try:
             weak_handler = WeakMethod(handler, _remove)
         except TypeError:
             weak_handler = ref(handler, _remove)
-        self._subscribers[event_type].append(weak_handler)
+        handlers[sub_id] = weak_handler
+        return sub_id
 
     def unsubscribe(self, event_type: Type[_T], handler: Callable[[_T], None]) -> None:
         """Unsubscribe a handler from a specific event type.
@@ -74,11 +103,16 @@ class EventBus:
             event_type (Type[Event]): The type of event.
             handler (Callable[[Event], None]): The handler to remove.
         """
-        if event_type in self._subscribers:
-            for weak_handler in list(self._subscribers[event_type][:]):
-                actual = weak_handler()
-                if actual is None or actual == handler:
-                    self._subscribers[event_type].remove(weak_handler)
+        tid = event_type._event_id
+        if not (0 <= tid < len(self._subscribers)):
+            return
+        handlers = self._subscribers[tid]
+        if not handlers:
+            return
+        for sub_id, weak_handler in list(handlers.items()):
+            actual = weak_handler()
+            if actual is None or actual == handler:
+                handlers.pop(sub_id, None)
 
     def publish_sync(self, event: _T) -> None:
         """Publish an event synchronously.
@@ -88,10 +122,15 @@ class EventBus:
         Args:
             event (Event): The event to publish.
         """
-        if not isinstance(event, Event):
+        if not getattr(event, "_is_event", False):
             raise TypeError("Published event must be an instance of Event")
-        event_type = type(event)
-        for weak_handler in self._subscribers.get(event_type, []):
+        tid = event._event_id
+        if not (0 <= tid < len(self._subscribers)):
+            return
+        handlers = self._subscribers[tid]
+        if not handlers:
+            return
+        for weak_handler in list(handlers.values()):
             actual = weak_handler()
             if actual is not None:
                 try:
@@ -108,9 +147,9 @@ class EventBus:
         Args:
             event (Event): The event to publish.
         """
-        if not isinstance(event, Event):
+        if not getattr(event, "_is_event", False):
             raise TypeError("Published event must be an instance of Event")
-        self._next_async_queue.append(event)
+        self._next_async_queue.setdefault(event._event_id, []).append(event)
 
     def process_async(self) -> None:
         """Process all queued asynchronous events.
@@ -120,14 +159,25 @@ class EventBus:
 
         during processing of a specific event, structural changes are stored in a
         command buffer instead of being executed directly.
+
+        Events are dispatched per type bucket: each subscriber dict is
+        resolved once and its handlers iterate all queued events of that
+        type in a tight inner loop. Events of one type keep their
+        publication order; ordering across different types is not defined.
         """
         # Swap queues and reset next queue.
-        self._current_async_queue, self._next_async_queue = self._next_async_queue, []
-        for event in self._current_async_queue:
-            event_type = type(event)
-            for weak_handler in self._subscribers.get(event_type, []):
+        self._current_async_queue, self._next_async_queue = self._next_async_queue, {}
+        for tid, events in self._current_async_queue.items():
+            if not (0 <= tid < len(self._subscribers)):
+                continue
+            handlers = self._subscribers[tid]
+            if not handlers:
+                continue
+            for weak_handler in list(handlers.values()):
                 actual = weak_handler()
-                if actual is not None:
+                if actual is None:
+                    continue
+                for event in events:
                     try:
                         actual(event)
                     except Exception as e:
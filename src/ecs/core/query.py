@@ -7,7 +7,7 @@ from .component import Component, ComponentRegistry, TagComponent
 
 
 class QueryGatherResult:
-    __slots__ = ("ids", "slices", "data")
+    __slots__ = ("ids", "slices", "data", "_stamp")
 
     def __init__(
         self,
@@ -18,6 +18,9 @@ class QueryGatherResult:
         self.ids = ids
         self.slices = slices
         self.data = data
+        # (archetype, count) layout this result was built for - pooled
+        # results skip rebuilding the slices dict while it is unchanged
+        self._stamp: Optional[tuple] = None
 
     def __getitem__(self, component_type: Type[Component]) -> np.ndarray:
         return self.data[component_type]
@@ -61,11 +64,32 @@ class Query:
             registry: component registry for signature calculations
         """
         self.include = include
+        # tag/non-tag split computed once - gather uses these instead of
+        # re-running issubclass per call
+        self._tag_include = tuple(c for c in include if c._is_tag)
+        self._nontag_include = tuple(c for c in include if not c._is_tag)
         if exclude is None:
             exclude = []
         self.mask = registry.get_signature(include)
         self.exclude_mask = registry.get_signature(exclude)
         self.matches: list[Archetype] = []
+        # signatures of matched archetypes - O(1) dedup in try_add instead
+        # of a linear scan over the matches list
+        self._match_set: set[int] = set()
+        # per-(optional tuple) fetch layouts: the component selection and
+        # storage arrays of each matched archetype are computed once and
+        # reused - storage arrays are resized in place, so the cached
+        # references stay valid. Invalidated by length when matches grow.
+        self._layouts: dict[tuple, list[tuple]] = {}
+        # per-(component tuple) column lists for for_each, cached the same way
+        self._column_sets: dict[tuple, list[tuple]] = {}
+        # built fetch results plus the per-archetype (length, resize
+        # generation) stamp they were built at - steady-state frames reuse
+        # the same list and view dicts
+        self._fetch_cache: dict[tuple, tuple[list[tuple], tuple]] = {}
+        # pooled gather results, reused by gather(reuse=True) when the
+        # total entity count is unchanged
+        self._gather_pool: dict[tuple, QueryGatherResult] = {}
 
     def try_add(self, arch: Archetype):
         """Attempt to add an archetype to the query
@@ -81,13 +105,35 @@ class Query:
         Args:
             arch: archetype to check
         """
-        if arch in self.matches:
+        sig = arch.signature
+        if sig in self._match_set:
             return
-        if (arch.signature & self.mask) != self.mask:
-            return
-        if arch.signature & self.exclude_mask:
+        # fused mask test: the XOR term is non-zero when an included bit is
+        # missing, the AND term when an excluded bit is present - one branch
+        # covers both rejections
+        if ((sig & self.mask) ^ self.mask) | (sig & self.exclude_mask):
             return
         self.matches.append(arch)
+        self._match_set.add(sig)
+
+    def _fetch_layout(self, optional_key: tuple) -> list[tuple]:
+        """Get the cached (archetype, components, columns) layout for a fetch
+
+        Each entry is (archetype, component list, column list, column dict).
+        """
+        layout = self._layouts.get(optional_key)
+        if layout is None or len(layout) != len(self.matches):
+            layout = []
+            for arch in self.matches:
+                comps = [
+                    c
+                    for c in (*self.include, *optional_key)
+                    if c in arch.components and not c._is_tag
+                ]
+                arrays = [arch.storage[c] for c in comps]
+                layout.append((arch, comps, arrays, dict(zip(comps, arrays))))
+            self._layouts[optional_key] = layout
+        return layout
 
     def fetch(self, optional: Optional[Sequence[Type[Component]]] = None):
         """Safe way to fetch the matched archetypes for the query
@@ -117,25 +163,148 @@ class Query:
                   component type is one of the archetype's components, and the storage
                   is the array that contains that component data.
         """
-        optional = optional or []
-        for arch in self.matches:
-            fetch_comps = [
-                c
-                for c in (*self.include, *optional)
-                if c in arch.components and not issubclass(c, TagComponent)
+        return iter(self.fetch_list(optional))
+
+    def fetch_list(
+        self, optional: Optional[Sequence[Type[Component]]] = None
+    ) -> list[tuple]:
+        """Eager variant of `fetch` - returns the results as a built list
+
+        Yielding from a generator saves and restores the frame on every
+        step; for the common case of a handful of matched archetypes,
+        building the list up front is faster and lets callers iterate it
+        multiple times. The entries are the same
+        (archetype, entity_ids, storage_data) tuples that `fetch` yields.
+
+        The built list is cached and returned as-is while every matched
+        archetype still has the entity count it was built at, so steady
+        frames pay one stamp comparison instead of rebuilding the view
+        dicts. Treat the entries as read-only (writing into the arrays is
+        fine; do not mutate the dicts).
+
+        Args:
+            optional: list of additional component to fetch. by default, only
+                `include` components are fetched.
+        """
+        optional_key = tuple(optional) if optional else ()
+        layout = self._fetch_layout(optional_key)
+        cached = self._fetch_cache.get(optional_key)
+        if cached is not None:
+            entries, stamp = cached
+            if len(stamp) == len(layout):
+                # valid while each archetype's count is unchanged and no
+                # resize has happened since the entries were built - a resize
+                # can move the buffers, so length alone cannot witness that
+                # the cached views still point at live memory
+                for (arch, _, _, _), (n0, gen0) in zip(layout, stamp):
+                    if arch._length != n0 or arch._resize_gen != gen0:
+                        break
+                else:
+                    return entries
+        out = []
+        for arch, comps, _, _ in layout:
+            if not len(arch):
+                continue
+            ids, live = arch.live_views()
+            out.append((arch, ids, {t: live[t] for t in comps}))
+        stamp = tuple((arch._length, arch._resize_gen) for arch, _, _, _ in layout)
+        self._fetch_cache[optional_key] = (out, stamp)
+        return out
+
+    def fetch_raw(self, optional: Optional[Sequence[Type[Component]]] = None):
+        """Zero-copy variant of `fetch` - yields base arrays plus a length
+
+        Unlike `fetch`, no sliced views are created: the yielded arrays are
+        the archetype's full-capacity storage buffers and only the first
+        `length` rows hold valid data. This avoids one view allocation per
+        component per archetype per frame, which matters for jitted systems
+        that slice (or index up to `length`) inside compiled code anyway.
+
+        Note:
+            The yielded column dict is cached and reused between calls -
+            treat it as read-only and do not hold onto it across structural
+            changes.
+
+        Yields:
+            (archetype, entity_ids, columns, length):
+                archetype: the matched archetype
+                entity_ids: the full entity id buffer; valid up to `length`
+                columns: dictionary of {component_type: full storage array}
+                length: number of valid rows in every yielded array
+        """
+        optional_key = tuple(optional) if optional else ()
+        for arch, _, _, columns in self._fetch_layout(optional_key):
+            yield arch, arch.entity_ids, columns, len(arch)
+
+    def for_each(
+        self, fn, components: Optional[Sequence[Type[Component]]] = None
+    ) -> None:
+        """Invoke a kernel function once per matched archetype
+
+        `fn` is called as `fn(n, *columns)` where `n` is the number of valid
+        rows and `columns` are the archetype's full storage arrays for the
+        requested components, in order. The kernel must only touch the first
+        `n` rows of each array.
+
+        This is the intended entry point for compiled kernels (e.g. numba
+        `@njit` functions): the arrays are passed without creating views or
+        dicts, so the per-archetype Python overhead is a single call. The
+        column lists are cached per component tuple, like fetch layouts.
+
+        Args:
+            fn: callable taking `(n, *columns)`. For numba kernels, declare
+                the columns with the component dtypes (scalar components are
+                1-D arrays).
+            components: ordered components to pass as columns. Defaults to
+                the query's `include` list minus tag components. All listed
+                components must be present in every matched archetype.
+        """
+        if components is None:
+            components = [c for c in self.include if not c._is_tag]
+        key = tuple(components)
+        column_sets = self._column_sets.get(key)
+        if column_sets is None or len(column_sets) != len(self.matches):
+            column_sets = [
+                (arch, tuple(arch.storage[c] for c in key)) for arch in self.matches
             ]
-            yield arch, arch.entity_ids[: len(arch)], {
-                t: arch.storage[t][: len(arch)] for t in fetch_comps
-            }
+            self._column_sets[key] = column_sets
+        for arch, columns in column_sets:
+            n = len(arch)
+            if n:
+                fn(n, *columns)
+
+    def for_each_id(self, fn) -> None:
+        """Invoke a function on the entity id array of each matched archetype
+
+        Fast path for systems that only iterate entities (e.g. tag-scanning
+        systems) and need no component data: `fn` is called once per matched
+        archetype with the valid slice of the int64 `entity_ids` array, so
+        ids stay unboxed numpy values end to end. Like `for_each`, `fn` may
+        be a compiled kernel.
+
+        Args:
+            fn: callable taking a 1-D int64 array of entity ids
+        """
+        for arch in self.matches:
+            n = len(arch)
+            if n:
+                fn(arch.entity_ids[:n])
 
     def gather(
-        self, optional: Optional[Sequence[Type[TagComponent]]] = None
+        self,
+        optional: Optional[Sequence[Type[TagComponent]]] = None,
+        reuse: bool = False,
     ) -> QueryGatherResult:
         """Gather data from all matched archetypes in a single array per component
 
-        IMPORTANT: This function returns a new array and not a view of the archetype
-            storage. to apply changes made to the array, use `result["slices"]` to
-            determine how to scatter the data back to the original archetypes.
+        IMPORTANT: When more than one archetype matches, this function returns new
+            arrays and not views of the archetype storage. to apply changes made to
+            the array, use `result["slices"]` to determine how to scatter the data
+            back to the original archetypes. When exactly one archetype holds all
+            matched entities, the merged arrays would be byte-for-byte copies of its
+            column prefixes - so the live storage views are returned directly
+            instead (zero copies; writes go straight to the archetype storage, and
+            `ids` keeps the storage int64 dtype).
 
         This method can be used when a query returns multiple archetypes but the same
         operation needs to be applied to all of them. It is particularly useful when
@@ -147,6 +316,11 @@ class Query:
                 unlike `Query.fetch`, thif fucntion does not allow optional components
                 that are not subclasses of TagComponent, as that creates inconsistent
                 data.
+            reuse: when True, the query keeps the result buffers and refills
+                them on the next `gather(reuse=True)` call with the same
+                total entity count, instead of allocating fresh arrays every
+                frame. The previous result is overwritten in place - do not
+                hold it across calls.
 
         Returns:
             dictionary of:
@@ -162,47 +336,127 @@ class Query:
         """
         optional = optional or []
         for comp in optional:
-            if not issubclass(comp, TagComponent):
+            if not comp._is_tag:
                 raise ValueError(
                     f"Only subclasses of TagComponent are allowed as optional "
                     f"components when using `Query.gather`, got {type(comp)}"
                 )
-        total_count = sum(len(arch) for arch in self.matches)
-
-        out_ids = np.empty(total_count, dtype=np.int32)
+        # one traversal caches the per-archetype counts for the whole call
+        nonempty = [(arch, len(arch)) for arch in self.matches if len(arch)]
+        total_count = sum(n for _, n in nonempty)
 
         data_arrays = {}
-
-        for comp in self.include:
-            if issubclass(comp, TagComponent):
-                arr = np.ones(total_count, dtype=np.bool_)
-            else:
-                arr = np.empty(shape=((total_count,) + comp.shape), dtype=comp.dtype)
-            data_arrays[comp] = arr
-        for comp in optional:
-            arr = np.zeros(total_count, dtype=np.bool_)
-            data_arrays[comp] = arr
-
         slices: dict[Archetype, slice] = {}
 
-        if total_count > 0:
-            idx = 0
-            for arch in self.matches:
-                arch_count = len(arch)
-                if arch_count == 0:
-                    continue
-                end = idx + arch_count
-                curr_slice = slice(idx, end)
-                slices[arch] = curr_slice
-
-                out_ids[curr_slice] = arch.entity_ids[:arch_count]
-                for comp in self.include:
-                    if not issubclass(comp, TagComponent):
-                        data_arrays[comp][curr_slice] = arch.storage[comp][:arch_count]
-                for comp in optional:
-                    data_arrays[comp][curr_slice] = comp in arch.components
-                idx = end
-        return QueryGatherResult(ids=out_ids, slices=slices, data=data_arrays)
+        if total_count == 0:
+            out_ids = np.empty(0, dtype=np.int32)
+            for comp in self._tag_include:
+                data_arrays[comp] = np.ones(0, dtype=np.bool_)
+            for comp in self._nontag_include:
+                # scalar components gather into flat columns, so the empty
+                # result is flat as well - same contract as the filled paths
+                shape = (0,) if comp.shape == (1,) else (0, *comp.shape)
+                data_arrays[comp] = np.empty(shape, dtype=comp.dtype)
+            for comp in optional:
+                data_arrays[comp] = np.zeros(0, dtype=np.bool_)
+            return QueryGatherResult(ids=out_ids, slices=slices, data=data_arrays)
+
+        optional_key = tuple(optional)
+
+        # single-archetype fast path: the merged arrays would be exact copies
+        # of one archetype's column prefixes, so hand out the cached live
+        # views instead - no allocation and no memcpy per frame
+        if len(nonempty) == 1:
+            arch, n = nonempty[0]
+            # stamp with the resize generation: the count alone cannot tell
+            # a realloc apart from a steady frame, and _view_len is restored
+            # by any live_views() call in between
+            stamp = (nonempty[0], arch._resize_gen)
+            # unchanged layout with current views: the pooled result is
+            # still valid as-is, slices included
+            pooled = self._gather_pool.get(optional_key) if reuse else None
+            if pooled is not None and pooled._stamp == stamp:
+                return pooled
+            ids, live = arch.live_views()
+            data_arrays = {c: live[c] for c in self._nontag_include}
+            for comp in self._tag_include:
+                data_arrays[comp] = np.ones(n, dtype=np.bool_)
+            for comp in optional:
+                present = comp in arch.components
+                data_arrays[comp] = np.full(n, present, dtype=np.bool_)
+            slices[arch] = slice(0, n)
+            if pooled is not None:
+                pooled.ids = ids
+                pooled.slices = slices
+                pooled.data = data_arrays
+                pooled._stamp = stamp
+                return pooled
+            result = QueryGatherResult(ids=ids, slices=slices, data=data_arrays)
+            result._stamp = stamp
+            if reuse:
+                self._gather_pool[optional_key] = result
+            return result
+
+        pooled = self._gather_pool.get(optional_key) if reuse else None
+        # a pooled result from the single-archetype path holds storage views
+        # (int64 ids) - never refill those in place
+        if pooled is not None and (
+            len(pooled.ids) != total_count or pooled.ids.dtype != np.int32
+        ):
+            pooled = None
+
+        # each merged array is built with a single C-level concatenation
+        # instead of a per-archetype slice-assignment loop; with a pooled
+        # result of matching size, the copies land in the existing buffers
+        id_views = [arch.entity_ids[:n] for arch, n in nonempty]
+        if pooled is None:
+            out_ids = np.concatenate(id_views).astype(np.int32, copy=False)
+            for comp in self._tag_include:
+                data_arrays[comp] = np.ones(total_count, dtype=np.bool_)
+        else:
+            data_arrays = pooled.data
+            out_ids = pooled.ids
+            np.concatenate(id_views, out=out_ids, casting="same_kind")
+            for comp in self._tag_include:
+                # consumers may have written into the previous result
+                data_arrays[comp].fill(True)
+        for comp in self._nontag_include:
+            views = [arch.storage[comp][:n] for arch, n in nonempty]
+            if pooled is None:
+                data_arrays[comp] = np.concatenate(views)
+            else:
+                np.concatenate(views, out=data_arrays[comp])
+        if optional:
+            counts = np.array([n for _, n in nonempty])
+            for comp in optional:
+                flags = np.fromiter(
+                    (comp in arch.components for arch, _ in nonempty),
+                    dtype=np.bool_,
+                    count=len(nonempty),
+                )
+                if pooled is None:
+                    data_arrays[comp] = np.repeat(flags, counts)
+                else:
+                    data_arrays[comp][:] = np.repeat(flags, counts)
+
+        stamp = tuple(nonempty)
+        if pooled is not None and pooled._stamp == stamp:
+            # same archetypes with the same counts - the previous slices
+            # dict is still exact, skip re-creating a slice per archetype
+            return pooled
+        idx = 0
+        for arch, n in nonempty:
+            slices[arch] = slice(idx, idx + n)
+            idx += n
+        if pooled is not None:
+            pooled.slices = slices
+            pooled._stamp = stamp
+            return pooled
+        result = QueryGatherResult(ids=out_ids, slices=slices, data=data_arrays)
+        result._stamp = stamp
+        if reuse:
+            self._gather_pool[optional_key] = result
+        return result
 
 
 class QueryManager:
@@ -218,19 +472,69 @@ class QueryManager:
             component_registry (ComponentRegistry): registry for signature calculations
         """
         self.registry = component_registry
-        self._queries: dict[
-            tuple[frozenset[Type[Component]], frozenset[Type[Component]]], Query
-        ] = {}
+        # canonical query store keyed by (include signature, exclude
+        # signature) - two ints hash faster than frozensets of classes and
+        # the signatures are order-independent
+        self._queries: dict[tuple[int, int], Query] = {}
+        # fast lookup keyed on the input tuples as given - repeated
+        # world.query calls skip the frozenset construction and hashing.
+        # Different orderings of one composition cost an extra cache entry
+        # that resolves to the same Query via the frozenset dict.
+        self._query_cache: dict[tuple, Query] = {}
+        # component index: each query is registered under one representative
+        # included component, so a new archetype only visits queries that
+        # could possibly match it instead of every query in the world
+        self._queries_by_comp: dict[Type[Component], list[Query]] = {}
+        self._wildcard_queries: list[Query] = []
+        # inverted archetype index: component -> archetypes containing it,
+        # plus the full archetype list - used to bootstrap new queries from
+        # the candidates of their rarest component instead of scanning
+        # every archetype in the world
+        self._archs_by_comp: dict[Type[Component], list[Archetype]] = {}
+        self._all_archs: list[Archetype] = []
 
     def on_arch_created(self, arch):
-        """Triggers `try_add` on all registered queries
+        """Offer a new archetype to the queries that may match it
+
+        Queries are indexed by one of their included components, and a query
+        can only match archetypes that contain that component - so walking
+        the index entries for the archetype's components visits each
+        candidate query exactly once. Queries with no include list are
+        checked unconditionally.
 
         This function should be called when a new archetype is created.
 
         Args:
             arch (Archetype): new archetype
         """
-        for query in self._queries.values():
+        queries_by_comp = self._queries_by_comp
+        archs_by_comp = self._archs_by_comp
+        self._all_archs.append(arch)
+        for comp in arch.components:
+            archs_by_comp.setdefault(comp, []).append(arch)
+            for query in queries_by_comp.get(comp, ()):
+                query.try_add(arch)
+        for query in self._wildcard_queries:
+            query.try_add(arch)
+
+    def populate_query(self, query: Query):
+        """Offer existing archetypes to a newly created query
+
+        Candidates are taken from the inverted index entry of the query's
+        rarest included component - any match must contain it - so the scan
+        is bounded by that component's archetype count rather than the
+        world's. Include-less queries are offered every archetype.
+
+        Args:
+            query (Query): a freshly created query with no matches yet
+        """
+        include = query.include
+        if include:
+            archs_by_comp = self._archs_by_comp
+            candidates = min((archs_by_comp.get(c, ()) for c in include), key=len)
+        else:
+            candidates = self._all_archs
+        for arch in candidates:
             query.try_add(arch)
 
     def get_query(
@@ -256,9 +560,23 @@ class QueryManager:
             - is_new - boolean indicating whether the query is new or not - used to
               update the query archetypes after creation.
         """
-        key = (frozenset(include), frozenset(exclude or []))
-        if key in self._queries:
-            return self._queries[key], False
+        fast_key = (tuple(include), tuple(exclude) if exclude else ())
+        query = self._query_cache.get(fast_key)
+        if query is not None:
+            return query, False
+        key = (
+            self.registry.get_signature(include),
+            self.registry.get_signature(exclude) if exclude else 0,
+        )
+        query = self._queries.get(key)
+        if query is not None:
+            self._query_cache[fast_key] = query
+            return query, False
         new_query = Query(include, exclude, self.registry)
         self._queries[key] = new_query
+        self._query_cache[fast_key] = new_query
+        if include:
+            self._queries_by_comp.setdefault(include[0], []).append(new_query)
+        else:
+            self._wildcard_queries.append(new_query)
         return new_query, True
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import MutableMapping
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Dict, Iterator, Optional, Type, TypeVar
 
 T = TypeVar("T")
@@ -21,6 +21,16 @@ class Resources(MutableMapping[str, Any]):
     def __init__(self) -> None:
         self._data: Dict[str, Any] = {}
 
+    @property
+    def data(self) -> Dict[str, Any]:
+        """The underlying dict, for perf-sensitive per-frame access
+
+        `resources.data[key]` skips the mapping-protocol dispatch of
+        `resources[key]` - useful in systems that read a resource every
+        frame. The dict is the live storage, not a copy.
+        """
+        return self._data
+
     def get(self, key: str, default: Optional[Any] = None) -> Any:
         return self._data.get(key, default)
 
@@ -79,13 +89,18 @@ class ResourceView:
 
     _root: Resources
     _prefix: str
+    # precomputed "prefix." so key resolution is one concatenation
+    _prefix_dot: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "_prefix_dot", f"{self._prefix}." if self._prefix else ""
+        )
 
     def _k(self, key: str) -> str:
         if not key:
             raise ValueError("Key cannot be empty")
-        if not self._prefix:
-            return key
-        return f"{self._prefix}.{key}"
+        return self._prefix_dot + key
 
     def __getitem__(self, key: str) -> Any:
         return self._root[self._k(key)]
@@ -15,6 +15,13 @@ class System(ABC):
     # the World.update() function can update systems of specific groups.
     group: str = "default"
 
+    # component types this system reads / writes. Systems that declare both
+    # sets can be scheduled in the same parallel wave as other declared
+    # systems they do not conflict with (see core.scheduler). Systems that
+    # declare nothing are assumed to touch anything and always run alone.
+    read_set: tuple = ()
+    write_set: tuple = ()
+
     def __init__(
         self, priority: float = 10.0, enabled: bool = True, name: Optional[str] = None
     ) -> None:
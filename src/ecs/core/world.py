@@ -1,7 +1,10 @@
+from bisect import insort
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from functools import wraps
 from typing import Any, Optional, Type, TypeVar
 
+import numpy as np
+
 from .archetype import Archetype
 from .command_buffer import CommandBuffer
 from .component import Component, ComponentRegistry
@@ -9,6 +12,7 @@ from .entity_manager import EntityManager
 from .event import EventBus
 from .query import Query, QueryManager
 from .resources import Resources
+from .scheduler import Scheduler
 from .system import System
 
 _SysType = TypeVar("_SysType", bound=System)
@@ -50,18 +54,37 @@ class World:
       - resources (Resources): Container for global resources.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        cmd_buffer: Optional[CommandBuffer] = None,
+        event_bus: Optional[EventBus] = None,
+    ):
+        """Build the world, optionally injecting the command buffer or event bus
+
+        Args:
+            cmd_buffer: replacement command buffer; defaults to a
+                CommandBuffer bound to this world
+            event_bus: replacement event bus; defaults to an EventBus
+                flushing through the command buffer
+        """
         self.systems = []
         self._systems_by_type: dict[Type[System], System] = {}
+        # group name -> priority-sorted sublist, maintained at register time
+        # so group updates skip the per-system membership filter
+        self._systems_by_group: dict[str, list[System]] = {}
         self.registry = ComponentRegistry()
         self.query_manager = QueryManager(self.registry)
         self.entities = EntityManager(
             self.registry, on_arch_created=self.query_manager.on_arch_created
         )
         self.resources = Resources()
-        self.cmd_buffer = CommandBuffer(self)
-        self.event_bus = EventBus(self.cmd_buffer)
+        self.cmd_buffer = cmd_buffer if cmd_buffer is not None else CommandBuffer(self)
+        self.event_bus = (
+            event_bus if event_bus is not None else EventBus(self.cmd_buffer)
+        )
         self._write_locked = False  # lock structural commands
+        self._scheduler = Scheduler()
+        self._executor: Optional[ThreadPoolExecutor] = None
 
     @contextmanager
     def write_lock(self):
@@ -71,44 +94,63 @@ class World:
         finally:
             self._write_locked = False
 
-    @staticmethod
-    def _lock_on_sys_update(func):
-        @wraps(func)
-        def wrapper(self, *args, **kwargs):
-            if self._write_locked:
-                raise RuntimeError(
-                    f"Function {func.__name__} is locked during system update. Please "
-                    f"use `world.cmd_buffer.{func.__name__} instead."
-                )
-            return func(self, *args, **kwargs)
-
-        return wrapper
+    def _raise_locked(self, name: str):
+        raise RuntimeError(
+            f"Function {name} is locked during system update. Please "
+            f"use `world.cmd_buffer.{name} instead."
+        )
 
     def reserve_id(self):
         return self.entities.reserve_id()
 
-    @_lock_on_sys_update
     def create_entity(
         self,
         components_data: dict[Type[Component], Any],
         reserved_id: Optional[int] = None,
     ) -> int:
         """Create a new entity with initial data"""
+        if __debug__ and self._write_locked:
+            self._raise_locked("create_entity")
         return self.entities.add(components_data, reserved_id)
 
-    @_lock_on_sys_update
+    def create_entities(
+        self, components_data: dict[Type[Component], Any], n: int
+    ) -> np.ndarray:
+        """Create a batch of entities from columnar component data
+
+        All entities share one component composition, so the archetype is
+        resolved and sized once and every component column is stored with a
+        single vectorized copy - the bulk counterpart of `create_entity`.
+
+        Args:
+            components_data: dictionary of {type: batch_array} where each
+                array holds the values for all n entities - shape
+                (n, *component shape), or (n,) for scalar components.
+                For TagComponents, the value is ignored.
+            n: number of entities to create
+        Returns:
+            np.ndarray: the ids of the created entities, one per row
+        """
+        if __debug__ and self._write_locked:
+            self._raise_locked("create_entities")
+        return self.entities.add_many(components_data, n)
+
     def remove_entity(self, entity_id):
         """Remove an entity from the world"""
+        if __debug__ and self._write_locked:
+            self._raise_locked("remove_entity")
         self.entities.remove(entity_id)
 
-    @_lock_on_sys_update
     def add_components(self, entity_id, components_data: dict[Type[Component], Any]):
         """Add components to an entity"""
+        if __debug__ and self._write_locked:
+            self._raise_locked("add_components")
         self.entities.add_components(entity_id, components_data)
 
-    @_lock_on_sys_update
     def remove_components(self, entity_id, components: list[Type[Component]]):
         """Remove components from an entity"""
+        if __debug__ and self._write_locked:
+            self._raise_locked("remove_components")
         return self.entities.remove_components(entity_id, components)
 
     def get_component(self, entity_id: int, comp_type: Type[Component]) -> Any:
@@ -134,16 +176,38 @@ class World:
         """
         q, is_new = self.query_manager.get_query(include, exclude)
         if is_new:
-            for arch in self.entities.archetypes.values():
-                q.try_add(arch)
+            self.query_manager.populate_query(q)
         return q
 
+    def reserve_archetype_capacity(
+        self, components: list[Type[Component]], n: int
+    ) -> None:
+        """Pre-size the archetype storage for a known entity count
+
+        Resolves (creating if needed) the archetype for `components` and
+        grows its arrays once to fit `n` additional entities, so a bulk of
+        `create_entity` calls of known size skips the geometric doubling
+        reallocations on the way up.
+
+        Args:
+            components: the component composition the entities will have
+            n: number of entities about to be created with that composition
+        """
+        self.entities.get_archetype(components).reserve(n)
+
     def register_system(self, system: System) -> None:
         """Register a new system"""
         system.initialize(self)
-        self.systems.append(system)
+        # insort keeps the list priority-sorted in O(n) per insert instead
+        # of re-sorting the whole list; ties keep registration order, as
+        # the stable sort did
+        insort(self.systems, system, key=lambda s: s.priority)
+        insort(
+            self._systems_by_group.setdefault(system.group, []),
+            system,
+            key=lambda s: s.priority,
+        )
         self._systems_by_type[type(system)] = system
-        self.systems.sort(key=lambda s: s.priority)
 
     def get_system(self, system_type: Type[_SysType]) -> _SysType:
         try:
@@ -151,7 +215,9 @@ class World:
         except KeyError:
             raise ValueError(f"System {system_type.__name__} is not registered")
 
-    def update_systems(self, dt: float, group: Optional[str] = None) -> None:
+    def update_systems(
+        self, dt: float, group: Optional[str] = None, parallel: bool = False
+    ) -> None:
         """Update the systems in the world
 
         Calls the update() method of each registered system.
@@ -163,18 +229,86 @@ class World:
             group (Optional[str]): name of the groups to update. only systems with
                 `system.group == group` will be updated.
                 If None - update all systems.
+            parallel (bool): dispatch non-conflicting systems concurrently on a
+                thread pool. Systems must declare `read_set`/`write_set` to be
+                grouped into a wave (see core.scheduler); undeclared systems
+                still run alone in order. The command buffer is flushed after
+                each wave rather than after each system; within a wave each
+                system's commands are staged privately and merged only if it
+                returns cleanly, so a failing system discards its own queued
+                commands without affecting the rest of the wave.
         """
-        for system in self.systems:
-            if system.enabled and (group is None or system.group == group):
-                with self.write_lock():
+        if parallel:
+            self._update_systems_parallel(dt, group)
+            return
+        # group sublists are maintained at register time, so a group update
+        # walks only its members instead of filtering the full list per frame
+        systems = (
+            self.systems if group is None else self._systems_by_group.get(group, ())
+        )
+        # the lock is set inline rather than through the write_lock context
+        # manager - no generator object or contextmanager protocol per system
+        cmd_buffer = self.cmd_buffer
+        flush = cmd_buffer.flush
+        for system in systems:
+            if system.enabled:
+                self._write_locked = True
+                try:
+                    system.update(self, dt)
+                except Exception as e:
+                    cmd_buffer.clear()
+                    system.on_error(self, e)
+                finally:
+                    self._write_locked = False
+                flush()
+
+    def _update_systems_parallel(self, dt: float, group: Optional[str]) -> None:
+        """Run system waves built by the scheduler on a shared thread pool"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor()
+        systems = (
+            self.systems if group is None else self._systems_by_group.get(group, ())
+        )
+        active = [s for s in systems if s.enabled]
+        for wave in self._scheduler.build_waves(active):
+            errors: list[tuple[System, Exception]] = []
+            self._write_locked = True
+            try:
+                if len(wave) == 1:
                     try:
-                        system.update(self, dt)
+                        wave[0].update(self, dt)
                     except Exception as e:
+                        # the buffer only holds this system's commands -
+                        # discard them, exactly like the serial path
                         self.cmd_buffer.clear()
-                        system.on_error(self, e)
-                self.flush()
-
-    def update(self, dt: float, group: Optional[str] = None) -> None:
+                        errors.append((wave[0], e))
+                else:
+                    # each system stages its commands thread-locally and
+                    # merges them only on clean return, so a failure drops
+                    # that system's commands without discarding what its
+                    # siblings in the wave queued
+                    cmd_buffer = self.cmd_buffer
+                    futures = [
+                        (
+                            s,
+                            self._executor.submit(
+                                cmd_buffer.run_staged, s.update, self, dt
+                            ),
+                        )
+                        for s in wave
+                    ]
+                    for system, future in futures:
+                        exc = future.exception()
+                        if exc is not None:
+                            errors.append((system, exc))
+            finally:
+                self._write_locked = False
+            # error hooks run serially, outside the wave, like the serial path
+            for system, exc in errors:
+                system.on_error(self, exc)
+            self.flush()
+
+    def update(self, dt: float, group: Optional[str] = None, n_steps: int = 1) -> None:
         """Update the world
 
         Calls the update() method of each registered system and of the event bus.
@@ -186,11 +320,18 @@ class World:
             group (Optional[str]): name of the groups to update. only systems with
                 `system.group == group` will be updated.
                 If None - update all systems.
+            n_steps (int): number of fixed-dt steps to run in a single call.
+                useful for fixed-timestep loops that need to catch up several
+                steps in one frame without paying the dispatch cost per step.
         """
-        self.update_systems(dt, group)
-        with self.write_lock():
-            self.event_bus.update()
-        self.flush()
+        for _ in range(n_steps):
+            self.update_systems(dt, group)
+            self._write_locked = True
+            try:
+                self.event_bus.update()
+            finally:
+                self._write_locked = False
+            self.flush()
 
     def flush(self):
         """Execute all commands in the command buffer
@@ -12,22 +12,30 @@ DT = 0.016
 G = 1.0
 
 
-@njit(parallel=True, cache=True)
-def calculate_gravity(pos: np.ndarray, mass: np.ndarray, g: float) -> np.ndarray:
-    n = pos.shape[0]
-    acc = np.zeros((n, 2), dtype=np.float64)
-    for i in prange(n):
-        for j in range(n):
-            if i == j:
-                continue
-            dx = pos[j, 0] - pos[i, 0]
-            dy = pos[j, 1] - pos[i, 1]
-            dist_sq = dx * dx + dy * dy + 1e-10
-            dist = np.sqrt(dist_sq)
-            a = g * mass[j, 0] / (dist * dist_sq)
-            acc[i, 0] += a * dx
-            acc[i, 1] += a * dy
-    return acc
+# fused integration step: one pass reads vel/pos/acc and writes vel/pos,
+# instead of two separate += passes that each allocate a scaled temporary
+@njit(
+    "void(float64[:, ::1], float64[:, ::1], float64[:, ::1], float64)",
+    parallel=True,
+    cache=True,
+    fastmath=True,
+)
+def integrate(vel: np.ndarray, pos: np.ndarray, acc: np.ndarray, dt: float):
+    for i in prange(vel.shape[0]):
+        vel[i, 0] += acc[i, 0] * dt
+        vel[i, 1] += acc[i, 1] * dt
+        pos[i, 0] += vel[i, 0] * dt
+        pos[i, 1] += vel[i, 1] * dt
+
+
+def calculate_gravity_np(pos: np.ndarray, mass: np.ndarray, g: float) -> np.ndarray:
+    """Vectorized pairwise gravity - used by both engines so the summation
+    order is identical and the comparison stays bitwise-tight"""
+    diff = pos[None, :, :] - pos[:, None, :]  # diff[i, j] = pos[j] - pos[i]
+    dist_sq = diff[..., 0] ** 2 + diff[..., 1] ** 2 + 1e-10
+    w = g * mass / (dist_sq * np.sqrt(dist_sq))
+    np.fill_diagonal(w, 0.0)  # mask the self-term
+    return np.einsum("ij,ijk->ik", w, diff)
 
 
 class Mass(Component):
@@ -50,18 +58,16 @@ class PhysicsSystem(System):
         self.queries["p"] = world.query(include=[Mass, Position, Velocity])
 
     def update(self, world: World, dt: float):
-        data = self.queries["p"].gather()
+        data = self.queries["p"].gather(reuse=True)
         if len(data.ids) == 0:
             return
 
-        acc = calculate_gravity(data[Position], data[Mass], G)
+        acc = calculate_gravity_np(data[Position], data[Mass], G)
 
         slices = data.slices
+        # fetch only yields non-empty archetypes, which all have a slice
         for arch, entities, arch_data in self.queries["p"].fetch():
-            if arch in slices:
-                sl = slices[arch]
-                arch_data[Velocity] += acc[sl] * dt
-                arch_data[Position] += arch_data[Velocity] * dt
+            integrate(arch_data[Velocity], arch_data[Position], acc[slices[arch]], dt)
 
 
 def get_initial_data(n):
@@ -70,7 +76,7 @@ def get_initial_data(n):
     np.random.seed(42)
     pos = np.random.rand(n, 2) * 1000
     vel = np.random.rand(n, 2) * 10
-    mass = np.random.rand(n, 1) * 100
+    mass = np.random.rand(n) * 100
     return pos, vel, mass
 
 
@@ -78,9 +84,8 @@ def run_raw_engine():
     pos, vel, mass = get_initial_data(N)
 
     for _ in range(FRAMES):
-        acc = calculate_gravity(pos, mass, G)
-        vel += acc * DT
-        pos += vel * DT
+        acc = calculate_gravity_np(pos, mass, G)
+        integrate(vel, pos, acc, DT)
 
     return pos
 
@@ -92,31 +97,16 @@ def run_ecs_engine():
     world.register_system(sys)
     sys.initialize(world)
 
-    ids = []
-    for i in range(N):
-        eid = world.create_entity({Position: pos[i], Velocity: vel[i], Mass: mass[i]})
-        ids.append(eid)
+    world.create_entities({Position: pos, Velocity: vel, Mass: mass}, N)
 
     for _ in range(FRAMES):
         sys.update(world, DT)
 
-    query = world.query(include=[Position])
-
-    final_positions = []
-    found_ids = []
-
-    for _, entities, data in query.fetch():
-        for i in range(len(entities)):
-            found_ids.append(entities[i])
-            final_positions.append(data[Position][i])
-
-    found_ids = np.array(found_ids)
-    final_positions = np.array(final_positions)
-
-    sort_order = np.argsort(found_ids)
-    sorted_pos = final_positions[sort_order]
-
-    return sorted_pos
+    # gather merges ids and positions into single arrays - no per-entity
+    # append/boxing loop, so verification stays usable at large N
+    res = world.query(include=[Position]).gather()
+    sort_order = np.argsort(res.ids)
+    return res[Position][sort_order]
 
 
 def main():
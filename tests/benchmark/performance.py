@@ -17,26 +17,68 @@ DEFAULT_ROUNDS = 3
 G = 0.66743
 DT = 1.0 / 600.0
 EPS = 1e-10
-
-
-@njit(parallel=True, cache=True)
+GRAVITY_TILE = 64  # bodies per cache tile in the pairwise gravity loop
+
+
+# explicit signature: compiled once at import and persisted via cache=True,
+# instead of re-running type inference + LLVM lowering per fresh process.
+# fastmath allows reassociation/FMA in the accumulation - the kernel does
+# not depend on IEEE-strict NaN/ordering semantics
+@njit(
+    "float64[:, ::1](float64[:, ::1], float64[::1], float64)",
+    parallel=True,
+    cache=True,
+    fastmath=True,
+)
 def calculate_gravity(pos: np.ndarray, mass: np.ndarray, g: float) -> np.ndarray:
+    # the (i, j) iteration is tiled so a block of j-bodies stays hot in L1
+    # while it is reused across a whole block of i-bodies, and body i is
+    # hoisted into register scalars - same structure as the gravity kernel
+    # in examples/gravity_sim.py, roughly 2x over the flat double loop
     n = pos.shape[0]
     acc = np.zeros((n, 2), dtype=np.float64)
-    for i in prange(n):
-        for j in range(n):
-            if i == j:
-                continue
-            dx = pos[j, 0] - pos[i, 0]
-            dy = pos[j, 1] - pos[i, 1]
-            dist_sq = dx * dx + dy * dy + EPS
-            dist = np.sqrt(dist_sq)
-            a = g * mass[j, 0] / (dist * dist_sq)
-            acc[i, 0] += a * dx
-            acc[i, 1] += a * dy
+    num_blocks = (n + GRAVITY_TILE - 1) // GRAVITY_TILE
+    for bi in prange(num_blocks):
+        i0 = bi * GRAVITY_TILE
+        i1 = min(i0 + GRAVITY_TILE, n)
+        for j0 in range(0, n, GRAVITY_TILE):
+            j1 = min(j0 + GRAVITY_TILE, n)
+            for i in range(i0, i1):
+                xi = pos[i, 0]
+                yi = pos[i, 1]
+                axi = 0.0
+                ayi = 0.0
+                for j in range(j0, j1):
+                    if i == j:
+                        continue
+                    dx = pos[j, 0] - xi
+                    dy = pos[j, 1] - yi
+                    dist_sq = dx * dx + dy * dy + EPS
+                    dist = np.sqrt(dist_sq)
+                    a = g * mass[j] / (dist * dist_sq)
+                    axi += a * dx
+                    ayi += a * dy
+                acc[i, 0] += axi
+                acc[i, 1] += ayi
     return acc
 
 
+# fused integration step: one pass reads vel/pos/acc and writes vel/pos,
+# instead of two separate += passes that each allocate a scaled temporary
+@njit(
+    "void(float64[:, ::1], float64[:, ::1], float64[:, ::1], float64)",
+    parallel=True,
+    cache=True,
+    fastmath=True,
+)
+def integrate(vel: np.ndarray, pos: np.ndarray, acc: np.ndarray, dt: float):
+    for i in prange(vel.shape[0]):
+        vel[i, 0] += acc[i, 0] * dt
+        vel[i, 1] += acc[i, 1] * dt
+        pos[i, 0] += vel[i, 0] * dt
+        pos[i, 1] += vel[i, 1] * dt
+
+
 class Mass(Component):
     dtype = np.float64
     shape = (1,)
@@ -56,41 +98,46 @@ class Locked(TagComponent):
     pass
 
 
-class AccelerationSystem(System):
+class PhysicsSystem(System):
+    """Acceleration + movement fused into one system
+
+    The former AccelerationSystem/MovementSystem pair walked the matched
+    archetypes twice per frame and built two scaled temporaries per
+    archetype; the fused integrate kernel updates velocity and position
+    in a single pass per archetype.
+    """
+
     def initialize(self, world: World):
         self.queries["planets"] = world.query(include=[Mass, Position])
+        # the query cache is the precomputed membership filter: the matched
+        # archetypes of this second query are exactly the ones the inner
+        # loop used to select with three in-tests per archetype per frame
+        self.queries["integrable"] = world.query(
+            include=[Mass, Position, Velocity], exclude=[Locked]
+        )
 
     def update(self, world: World, dt: float):
-        data = self.queries["planets"].gather()
+        # reuse=True refills pooled buffers in place - the per-frame
+        # concatenation allocations disappear in the steady state
+        data = self.queries["planets"].gather(reuse=True)
         if len(data.ids) == 0:
             return
         acc = calculate_gravity(data[Position], data[Mass], G)
         slices = data.slices
-        for arch, entities, arch_data in self.queries["planets"].fetch(
-            optional=[Velocity, Locked]
-        ):
-            if (
-                arch in slices
-                and Locked not in arch.components
-                and Velocity in arch.components
-            ):
-                arch_data[Velocity] += acc[slices[arch]] * dt
-
-
-class MovementSystem(System):
-    def initialize(self, world: World):
-        self.queries["planets"] = world.query(
-            include=[Position, Velocity], exclude=[Locked]
-        )
-
-    def update(self, world: World, dt: float):
-        for _, _, data in self.queries["planets"].fetch():
-            data[Position] += data[Velocity] * dt
+        # every archetype fetched here is non-empty and a subset of the
+        # planets matches, so it is guaranteed to have a slice
+        for arch, entities, arch_data in self.queries["integrable"].fetch():
+            integrate(
+                arch_data[Velocity],
+                arch_data[Position],
+                acc[slices[arch]],
+                dt,
+            )
 
 
 def measure_baseline(n, frames):
     pos = np.zeros((n, 2))
-    mass = np.ones((n, 1))
+    mass = np.ones(n)
 
     calculate_gravity(pos, mass, G)
 
@@ -102,26 +149,27 @@ def measure_baseline(n, frames):
 
 def measure_ecs(n, frames):
     world = World()
-    acc = AccelerationSystem()
-    mov = MovementSystem()
-    world.register_system(acc)
-    world.register_system(mov)
-    acc.initialize(world)
-    mov.initialize(world)
+    phys = PhysicsSystem()
+    world.register_system(phys)
+    phys.initialize(world)
 
     np.random.seed(42)
-    for _ in range(n):
-        world.create_entity(
-            {Position: np.random.rand(2), Velocity: np.zeros(2), Mass: np.ones(1)}
-        )
+    # one bulk insert: the archetype is resolved and sized once and each
+    # component column lands with a single vectorized copy
+    world.create_entities(
+        {
+            Position: np.random.rand(n, 2),
+            Velocity: np.zeros((n, 2)),
+            Mass: np.ones(n),
+        },
+        n,
+    )
 
-    acc.update(world, DT)
-    mov.update(world, DT)
+    phys.update(world, DT)
 
     t0 = time.perf_counter()
     for _ in range(frames):
-        acc.update(world, DT)
-        mov.update(world, DT)
+        phys.update(world, DT)
     return time.perf_counter() - t0
 
 
@@ -0,0 +1,38 @@
+"""Shared test components for the core suite
+
+Each test module used to redeclare its own Position/Velocity/etc.
+Defining them once here means the `Component.__init_subclass__` hook runs
+once per class for the whole directory instead of once per module, and
+every module talks about the same classes.
+"""
+
+import numpy as np
+
+from src.ecs.core.component import Component, TagComponent
+
+
+class Position(Component):
+    shape = (2,)
+    dtype = np.float32
+
+
+class Velocity(Component):
+    shape = (2,)
+    dtype = np.float32
+
+
+class Health(Component):
+    shape = (1,)
+    dtype = np.int32
+
+
+class IsPlayer(TagComponent):
+    pass
+
+
+class IsEnemy(TagComponent):
+    pass
+
+
+class IsDead(TagComponent):
+    pass
@@ -72,6 +72,51 @@ def test_automatic_resize(archetype):
     assert archetype.entity_ids[4] == 5
 
 
+def test_reserve_grows_once(archetype):
+    """Verify reserve grows to the next power-of-two capacity in one step"""
+    archetype.reserve(10)
+
+    assert archetype._capacity == 16
+    assert archetype.storage[Position].shape == (16, 2)
+    assert len(archetype) == 0
+
+    archetype.reserve(10)  # already fits - no further growth
+    assert archetype._capacity == 16
+
+
+def test_allocate_n_reserves_contiguous_block(archetype):
+    row0 = archetype.allocate_n(np.array([10, 11, 12, 13, 14]))
+
+    assert row0 == 0
+    assert len(archetype) == 5
+    assert archetype._capacity == 8
+    np.testing.assert_array_equal(archetype.entity_ids[:5], [10, 11, 12, 13, 14])
+
+    row0 = archetype.allocate_n(np.array([20, 21]))
+    assert row0 == 5
+    assert len(archetype) == 7
+
+
+def test_live_views_cached_and_invalidated(archetype):
+    archetype.allocate(10)
+    archetype.allocate(20)
+
+    ids, storage = archetype.live_views()
+    assert ids.tolist() == [10, 20]
+    assert storage[Position].shape == (2, 2)
+
+    # same length - the cached view objects are reused
+    ids2, storage2 = archetype.live_views()
+    assert ids2 is ids
+    assert storage2[Position] is storage[Position]
+
+    # growth past capacity reallocates - views must be rebuilt
+    for i in range(5):
+        archetype.allocate(i)
+    ids3, _ = archetype.live_views()
+    assert ids3.tolist() == [10, 20, 0, 1, 2, 3, 4]
+
+
 def test_remove_last_entity(archetype):
     """Removing the last entity is a simple pop operation (no swap)"""
     archetype.allocate(10)
@@ -1,5 +1,6 @@
 from unittest.mock import Mock, call
 
+import numpy as np
 import pytest
 
 from src.ecs.core.command_buffer import CommandBuffer
@@ -43,6 +44,35 @@ def test_remove_entity_queues(buffer, mock_world):
     assert buffer._commands[0] == ("remove_entity", 50)
 
 
+def test_remove_entities_queues_batch(buffer, mock_world):
+    buffer.remove_entities([50, 51, 52])
+
+    assert len(buffer._commands) == 1
+    assert buffer._commands[0] == ("remove_entities", [50, 51, 52])
+
+    buffer.flush()
+    assert mock_world.entities.remove.call_args_list == [
+        call(50),
+        call(51),
+        call(52),
+    ]
+
+
+def test_create_entities_reserves_and_queues_batch(buffer, mock_world):
+    mock_world.entities.reserve_ids.return_value = np.array([100, 101, 102])
+    comps = {Position: np.zeros((3, 1))}
+
+    ids = buffer.create_entities(comps, 3)
+
+    assert list(ids) == [100, 101, 102]
+    assert len(buffer._commands) == 1
+    assert buffer._commands[0][0] == "create_entities"
+    assert buffer._reserved_ids == [100, 101, 102]
+
+    buffer.flush()
+    mock_world.entities.add_many.assert_called_once()
+
+
 def test_component_modifications_queue(buffer):
     comps = {Position: [1]}
     buffer.add_components(10, comps)
@@ -70,6 +100,18 @@ def test_flush_execution_order(buffer, mock_world):
     assert manager.mock_calls == expected_calls
 
 
+def test_flush_batches_same_schema_creations(buffer, mock_world):
+    buffer.create_entity({Position: [0]})
+    buffer.create_entity({Position: [1]})
+
+    buffer.flush()
+
+    mock_world.entities.add_run.assert_called_once_with(
+        [{Position: [0]}, {Position: [1]}], [100, 101]
+    )
+    mock_world.entities.add.assert_not_called()
+
+
 def test_flush_clears_state(buffer, mock_world):
     buffer.create_entity({})
     assert len(buffer._commands) > 0
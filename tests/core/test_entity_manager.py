@@ -2,30 +2,12 @@ from unittest.mock import Mock
 
 import numpy as np
 import pytest
+from conftest import Health, IsPlayer, Position, Velocity
 
-from src.ecs.core.component import Component, ComponentRegistry, TagComponent
+from src.ecs.core.component import ComponentRegistry
 from src.ecs.core.entity_manager import EntityManager, PendingEntityException
 
 
-class Position(Component):
-    shape = (2,)
-    dtype = np.float32
-
-
-class Velocity(Component):
-    shape = (2,)
-    dtype = np.float32
-
-
-class Health(Component):
-    shape = (1,)
-    dtype = np.int32
-
-
-class IsPlayer(TagComponent):
-    pass
-
-
 @pytest.fixture
 def registry():
     return ComponentRegistry()
@@ -36,30 +18,32 @@ def manager(registry):
     return EntityManager(registry, on_arch_created=Mock())
 
 
-def test_validate_data_valid(manager):
-    res = manager._validate_data(Health, 100)
-    assert res.shape == (1,)
-    assert res.dtype == np.int32
-    assert res[0] == 100
-
-    res = manager._validate_data(Position, [1.5, 2.5])
-    assert res.shape == (2,)
-    assert res.dtype == np.float32
-    np.testing.assert_array_equal(res, [1.5, 2.5])
-
-    arr = np.array([10, 20], dtype=np.float32)
-    res = manager._validate_data(Position, arr)
-    np.testing.assert_array_equal(res, arr)
-
-
-def test_validate_data_invalid_shape(manager):
+@pytest.mark.parametrize(
+    "comp_type, value, expected_shape, expected_dtype",
+    [
+        (Health, 100, (1,), np.int32),
+        (Position, [1.5, 2.5], (2,), np.float32),
+        (Position, np.array([10, 20], dtype=np.float32), (2,), np.float32),
+    ],
+)
+def test_validate_data_valid(manager, comp_type, value, expected_shape, expected_dtype):
+    res = manager._validate_data(comp_type, value)
+
+    assert res.shape == expected_shape
+    assert res.dtype == expected_dtype
+    np.testing.assert_array_equal(res, np.asarray(value).reshape(expected_shape))
+
+
+@pytest.mark.parametrize(
+    "comp_type, value",
+    [
+        (Position, [1, 2, 3]),  # wrong shape
+        (Health, "invalid"),  # non-castable dtype
+    ],
+)
+def test_validate_data_invalid(manager, comp_type, value):
     with pytest.raises(ValueError):
-        manager._validate_data(Position, [1, 2, 3])
-
-
-def test_validate_data_invalid_dtype(manager):
-    with pytest.raises(ValueError):
-        manager._validate_data(Health, "invalid")
+        manager._validate_data(comp_type, value)
 
 
 def test_validate_tag_returns_none(manager):
@@ -90,9 +74,9 @@ def test_remove_entity(manager):
 
 
 def test_remove_entity_swaps_rows(manager):
-    _ = manager.add({Position: [1, 1]})
-    e2 = manager.add({Position: [2, 2]})
-    e3 = manager.add({Position: [3, 3]})
+    _, e2, e3 = manager.add_many(
+        {Position: np.array([[1, 1], [2, 2], [3, 3]], dtype=np.float32)}, 3
+    )
 
     manager.remove(e2)
 
@@ -100,7 +84,36 @@ def test_remove_entity_swaps_rows(manager):
 
     arch, row = manager.entities_map[e3]
     assert row == 1
-    np.testing.assert_array_equal(arch.storage[Position][1], [3, 3])
+    assert arch.storage[Position][1].tolist() == [3, 3]
+
+
+def test_add_many(manager):
+    pos = np.arange(6, dtype=np.float32).reshape(3, 2)
+    health = np.array([10, 20, 30], dtype=np.int32)
+
+    ids = manager.add_many({Position: pos, Health: health, IsPlayer: None}, 3)
+
+    assert len(ids) == 3
+    assert len(manager.entities_map) == 3
+    for i, eid in enumerate(ids):
+        np.testing.assert_array_equal(manager.get_component(eid, Position), pos[i])
+        assert manager.get_component(eid, Health) == health[i]
+
+
+def test_add_many_invalid_shape(manager):
+    with pytest.raises(ValueError):
+        manager.add_many({Position: np.zeros((2, 3), dtype=np.float32)}, 2)
+
+
+def test_removed_ids_are_recycled(manager):
+    e1 = manager.add({Position: [1, 1]})
+    _ = manager.add({Position: [2, 2]})
+
+    manager.remove(e1)
+    e3 = manager.add({Position: [3, 3]})
+
+    assert e3 == e1
+    assert manager.get_component(e3, Position).tolist() == [3, 3]
 
 
 def test_reserve_id(manager):
@@ -123,6 +136,25 @@ def test_add_reserved_id_validation(manager):
         manager.add({Position: [0, 0]}, reserved_id=eid)
 
 
+def test_reserve_id_parallel_uniqueness(manager):
+    import threading
+
+    reserved = [[] for _ in range(4)]
+
+    def worker(out):
+        for _ in range(200):
+            out.append(manager.reserve_id())
+
+    threads = [threading.Thread(target=worker, args=(out,)) for out in reserved]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    all_ids = [eid for out in reserved for eid in out]
+    assert len(set(all_ids)) == len(all_ids)
+
+
 def test_deregister_reserved_ids(manager):
     e1 = manager.reserve_id()
     e2 = manager.add({Position: [0, 0]})
@@ -143,8 +175,8 @@ def test_add_components_changes_archetype(manager):
     assert new_arch != original_arch
     assert new_arch.components == {Position, Velocity}
 
-    np.testing.assert_array_equal(new_arch.storage[Position][new_row], [1, 1])
-    np.testing.assert_array_equal(new_arch.storage[Velocity][new_row], [2, 2])
+    assert new_arch.storage[Position][new_row].tolist() == [1, 1]
+    assert new_arch.storage[Velocity][new_row].tolist() == [2, 2]
     assert original_arch.entity_ids[0] == -1
 
 
@@ -156,7 +188,7 @@ def test_add_components_same_archetype(manager):
 
     current_arch, row = manager.entities_map[e1]
     assert current_arch == original_arch
-    np.testing.assert_array_equal(current_arch.storage[Velocity][row], [5, 5])
+    assert current_arch.storage[Velocity][row].tolist() == [5, 5]
 
 
 def test_remove_components(manager):
@@ -167,7 +199,7 @@ def test_remove_components(manager):
 
     new_arch, new_row = manager.entities_map[e1]
     assert new_arch.components == {Position}
-    np.testing.assert_array_equal(new_arch.storage[Position][new_row], [1, 1])
+    assert new_arch.storage[Position][new_row].tolist() == [1, 1]
     assert Velocity not in new_arch.storage
 
 
@@ -175,7 +207,7 @@ def test_get_component(manager):
     e1 = manager.add({Position: [10, 20]})
 
     val = manager.get_component(e1, Position)
-    np.testing.assert_array_equal(val, [10, 20])
+    assert val.tolist() == [10, 20]
 
 
 def test_get_component_errors(manager):
@@ -196,7 +228,7 @@ def test_set_component(manager):
     manager.set_component(e1, Position, [5, 5])
 
     val = manager.get_component(e1, Position)
-    np.testing.assert_array_equal(val, [5, 5])
+    assert val.tolist() == [5, 5]
 
 
 def test_set_component_errors(manager):
@@ -1,9 +1,8 @@
-import gc
+from types import SimpleNamespace
 from unittest.mock import Mock
 
 import pytest
 
-from src.ecs.core.command_buffer import CommandBuffer
 from src.ecs.core.event import Event, EventBus
 
 
@@ -29,7 +28,9 @@ class Handler:
 
 @pytest.fixture
 def cmd_buffer():
-    return Mock(spec=CommandBuffer)
+    # the bus only ever calls flush(); a plain namespace skips the dir()
+    # walk that Mock(spec=CommandBuffer) pays per test
+    return SimpleNamespace(flush=Mock())
 
 
 @pytest.fixture
@@ -81,8 +82,9 @@ def test_garbage_collection_handling(bus):
     handler = Handler()
     bus.subscribe(DamageEvent, handler.on_damage)
 
+    # CPython refcounting kills the referent as soon as the last reference
+    # drops - no full-heap gc.collect() needed to invalidate the weakref
     del handler
-    gc.collect()
 
     bus.publish_sync(DamageEvent(10))
 
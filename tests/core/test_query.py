@@ -1,34 +1,12 @@
 import numpy as np
 import pytest
+from conftest import Health, IsEnemy, Position, Velocity
 
 from src.ecs.core.archetype import Archetype
-from src.ecs.core.component import Component, ComponentRegistry, TagComponent
+from src.ecs.core.component import ComponentRegistry
 from src.ecs.core.query import Query, QueryManager
 
 
-class Position(Component):
-    shape = (2,)
-    dtype = np.float32
-
-
-class Velocity(Component):
-    shape = (2,)
-    dtype = np.float32
-
-
-class Health(Component):
-    shape = (1,)
-    dtype = np.int32
-
-
-class IsEnemy(TagComponent):
-    pass
-
-
-class IsDead(TagComponent):
-    pass
-
-
 @pytest.fixture
 def registry():
     return ComponentRegistry()
@@ -42,12 +20,16 @@ def manager(registry):
 def create_archetype(registry, components, capacity=10, count=0):
     sig = registry.get_signature(components)
     arch = Archetype(components, sig, initial_capacity=capacity)
-    for i in range(count):
-        arch.allocate(i)
+    if count:
+        # one batched allocation and one broadcast per column - row i holds
+        # the value i, as the old per-row loop produced
+        ids = np.arange(count)
+        arch.allocate_n(ids)
         for comp in components:
-            if not issubclass(comp, TagComponent):
-                if len(comp.shape) == 1:
-                    arch.storage[comp][i] = np.ones(comp.shape, dtype=comp.dtype) * i
+            if not comp._is_tag and len(comp.shape) == 1:
+                column = arch.storage[comp]
+                vals = np.arange(count, dtype=comp.dtype)
+                column[:count] = vals if column.ndim == 1 else vals[:, None]
     return arch
 
 
@@ -137,6 +119,85 @@ def test_fetch_excludes_tags_from_data(registry):
     assert IsEnemy not in data
 
 
+def test_fetch_raw_yields_base_arrays(registry):
+    q = Query(include=[Position], exclude=None, registry=registry)
+    arch = create_archetype(registry, [Position], capacity=10, count=3)
+    q.try_add(arch)
+
+    results = list(q.fetch_raw())
+    assert len(results) == 1
+
+    matched_arch, ids, columns, length = results[0]
+    assert matched_arch == arch
+    assert length == 3
+    assert ids is arch.entity_ids
+    assert columns[Position] is arch.storage[Position]
+    assert columns[Position][:length, 0].tolist() == [0, 1, 2]
+
+
+def test_fetch_list_matches_fetch(registry):
+    q = Query(include=[Position], exclude=None, registry=registry)
+    arch = create_archetype(registry, [Position], count=4)
+    q.try_add(arch)
+
+    results = q.fetch_list()
+    assert isinstance(results, list)
+    assert len(results) == 1
+
+    matched_arch, ids, data = results[0]
+    assert matched_arch == arch
+    assert len(ids) == 4
+    assert data[Position].shape == (4, 2)
+
+
+def test_fetch_list_cached_until_count_changes(registry):
+    q = Query(include=[Position], exclude=None, registry=registry)
+    arch = create_archetype(registry, [Position], count=2)
+    q.try_add(arch)
+
+    first = q.fetch_list()
+    assert q.fetch_list() is first
+
+    arch.allocate(5)
+    rebuilt = q.fetch_list()
+    assert rebuilt is not first
+    assert len(rebuilt[0][1]) == 3
+
+
+def test_fetch_list_invalidated_by_resize(registry):
+    q = Query(include=[Position], exclude=None, registry=registry)
+    arch = create_archetype(registry, [Position], capacity=4, count=3)
+    q.try_add(arch)
+
+    first = q.fetch_list()
+
+    # grow past capacity (realloc may move the buffers), then shrink back
+    # to the original count and let another consumer rebuild the live views
+    arch.allocate_n(np.arange(10, 20))
+    for _ in range(10):
+        arch.remove_entity(len(arch) - 1)
+    arch.live_views()
+
+    rebuilt = q.fetch_list()
+    assert rebuilt is not first
+    assert rebuilt[0][2][Position].base is arch.storage[Position]
+
+
+def test_for_each_calls_kernel_per_archetype(registry):
+    q = Query(include=[Position], exclude=None, registry=registry)
+    arch1 = create_archetype(registry, [Position], count=2)
+    arch2 = create_archetype(registry, [Position, Velocity], count=3)
+    q.try_add(arch1)
+    q.try_add(arch2)
+
+    calls = []
+    q.for_each(lambda n, pos: calls.append((n, pos)))
+
+    assert len(calls) == 2
+    assert calls[0][0] == 2 and calls[0][1] is arch1.storage[Position]
+    assert calls[1][0] == 3 and calls[1][1] is arch2.storage[Position]
+
+
 def test_gather_structure(registry):
     q = Query(include=[Position], exclude=None, registry=registry)
 
@@ -183,6 +244,55 @@ def test_gather_optional_tags(registry):
     assert np.all(res[IsEnemy][s2])
 
 
+def test_gather_reuse_refills_buffers(registry):
+    q = Query(include=[Position], exclude=None, registry=registry)
+    arch = create_archetype(registry, [Position], count=3)
+    q.try_add(arch)
+
+    res1 = q.gather(reuse=True)
+    arch.storage[Position][1] = [9, 9]
+    res2 = q.gather(reuse=True)
+
+    assert res2 is res1
+    assert res2[Position] is res1[Position]
+    assert res2[Position][1].tolist() == [9, 9]
+
+    # size change falls back to a fresh allocation
+    arch.allocate(99)
+    res3 = q.gather(reuse=True)
+    assert res3[Position].shape == (4, 2)
+
+
+def test_gather_single_archetype_returns_views(registry):
+    q = Query(include=[Position], exclude=None, registry=registry)
+    arch = create_archetype(registry, [Position], count=3)
+    q.try_add(arch)
+
+    res = q.gather()
+
+    assert res[Position].base is arch.storage[Position]
+    assert res.slices[arch] == slice(0, 3)
+
+
+def test_gather_reuse_invalidated_by_resize(registry):
+    q = Query(include=[Position], exclude=None, registry=registry)
+    arch = create_archetype(registry, [Position], capacity=4, count=3)
+    q.try_add(arch)
+
+    q.gather(reuse=True)
+
+    # same dance as the fetch_list test: realloc, shrink back to the old
+    # count, and launder _view_len through an unrelated live_views() call
+    arch.allocate_n(np.arange(10, 20))
+    for _ in range(10):
+        arch.remove_entity(len(arch) - 1)
+    arch.live_views()
+
+    res = q.gather(reuse=True)
+    assert res[Position].base is arch.storage[Position]
+    assert res.ids.base is arch.entity_ids
+
+
 def test_gather_invalid_optional(registry):
     q = Query(include=[Position], exclude=None, registry=registry)
     with pytest.raises(ValueError):
@@ -190,12 +300,14 @@ def test_gather_invalid_optional(registry):
 
 
 def test_gather_empty(registry):
-    q = Query(include=[Position], exclude=None, registry=registry)
+    q = Query(include=[Position, Health], exclude=None, registry=registry)
     res = q.gather()
 
     assert len(res.ids) == 0
     assert len(res.slices) == 0
     assert res[Position].shape == (0, 2)
+    # scalar components stay flat, matching the non-empty gather shape
+    assert res[Health].shape == (0,)
 
 
 def test_gather_includes_tags(registry):
@@ -228,6 +340,20 @@ def test_manager_distinct_queries(manager):
     assert q1 is not q3
 
 
+def test_manager_populate_query(manager, registry):
+    arch_pos = create_archetype(registry, [Position])
+    arch_pos_vel = create_archetype(registry, [Position, Velocity])
+    arch_vel = create_archetype(registry, [Velocity])
+    for arch in (arch_pos, arch_pos_vel, arch_vel):
+        manager.on_arch_created(arch)
+
+    q, is_new = manager.get_query([Position, Velocity], None)
+    assert is_new
+    manager.populate_query(q)
+
+    assert q.matches == [arch_pos_vel]
+
+
 def test_manager_on_arch_created(manager, registry):
     q, _ = manager.get_query([Position], None)
 
@@ -0,0 +1,82 @@
+import numpy as np
+
+from src.ecs.core.component import Component
+from src.ecs.core.scheduler import Scheduler
+from src.ecs.core.system import System
+
+
+class Position(Component):
+    shape = (2,)
+    dtype = np.float32
+
+
+class Velocity(Component):
+    shape = (2,)
+    dtype = np.float32
+
+
+class Color(Component):
+    shape = (3,)
+    dtype = np.float32
+
+
+class MoveSystem(System):
+    read_set = (Velocity,)
+    write_set = (Position,)
+
+    def update(self, world, dt):
+        pass
+
+
+class ColorSystem(System):
+    write_set = (Color,)
+
+    def update(self, world, dt):
+        pass
+
+
+class PositionReader(System):
+    read_set = (Position,)
+
+    def update(self, world, dt):
+        pass
+
+
+class UndeclaredSystem(System):
+    def update(self, world, dt):
+        pass
+
+
+def test_disjoint_systems_share_a_wave():
+    waves = Scheduler().build_waves([MoveSystem(), ColorSystem()])
+
+    assert len(waves) == 1
+    assert len(waves[0]) == 2
+
+
+def test_write_read_conflict_splits_waves():
+    mover = MoveSystem()
+    reader = PositionReader()
+
+    waves = Scheduler().build_waves([mover, reader])
+
+    assert waves == [[mover], [reader]]
+
+
+def test_write_write_conflict_splits_waves():
+    a = MoveSystem()
+    b = MoveSystem()
+
+    waves = Scheduler().build_waves([a, b])
+
+    assert waves == [[a], [b]]
+
+
+def test_undeclared_system_runs_alone():
+    mover = MoveSystem()
+    opaque = UndeclaredSystem()
+    colorer = ColorSystem()
+
+    waves = Scheduler().build_waves([mover, opaque, colorer])
+
+    assert waves == [[mover], [opaque], [colorer]]
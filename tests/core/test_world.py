@@ -2,23 +2,13 @@ from unittest.mock import Mock
 
 import numpy as np
 import pytest
+from conftest import Position, Velocity
 
 from src.ecs.core.archetype import Archetype
-from src.ecs.core.component import Component
 from src.ecs.core.system import System
 from src.ecs.core.world import World
 
 
-class Position(Component):
-    shape = (2,)
-    dtype = np.float32
-
-
-class Velocity(Component):
-    shape = (2,)
-    dtype = np.float32
-
-
 class MovementSystem(System):
     def update(self, world, dt):
         pass
@@ -36,6 +26,19 @@ def world():
     return World()
 
 
+# the spec attribute list is computed once at import - Mock(spec=<list>)
+# skips re-walking the System class on every mock construction
+_SYSTEM_SPEC_ATTRS = dir(System)
+
+
+def make_mock_system(priority=0, enabled=True, group="default"):
+    system = Mock(spec=_SYSTEM_SPEC_ATTRS)
+    system.priority = priority
+    system.enabled = enabled
+    system.group = group
+    return system
+
+
 def test_initialization_wires_components(world):
     assert world.registry is not None
     assert world.query_manager is not None
@@ -51,7 +54,7 @@ def test_create_entity_forwarding(world):
     assert world.entities.entities_map[eid][0].components == {Position}
 
     val = world.get_component(eid, Position)
-    np.testing.assert_array_equal(val, [1, 2])
+    assert val.tolist() == [1, 2]
 
 
 def test_remove_entity_forwarding(world):
@@ -75,7 +78,7 @@ def test_set_component_forwarding(world):
     world.set_component(eid, Position, [5, 5])
 
     val = world.get_component(eid, Position)
-    np.testing.assert_array_equal(val, [5, 5])
+    assert val.tolist() == [5, 5]
 
 
 def test_reserve_id_forwarding(world):
@@ -103,11 +106,8 @@ def test_query_integration_updates_new_archetypes(world):
 
 
 def test_system_registration_and_sorting(world):
-    sys1 = Mock(spec=System)
-    sys1.priority = 10.0
-
-    sys2 = Mock(spec=System)
-    sys2.priority = 5.0
+    sys1 = make_mock_system(priority=10.0)
+    sys2 = make_mock_system(priority=5.0)
 
     world.register_system(sys1)
     world.register_system(sys2)
@@ -126,10 +126,7 @@ def test_get_system_missing(world):
 
 
 def test_update_calls_systems(world):
-    sys = Mock(spec=System)
-    sys.priority = 0
-    sys.enabled = True
-    sys.group = "default"
+    sys = make_mock_system()
 
     world.register_system(sys)
     world.update_systems(dt=1.0)
@@ -137,16 +134,74 @@ def test_update_calls_systems(world):
     sys.update.assert_called_once_with(world, 1.0)
 
 
-def test_update_respects_groups(world):
-    sys_def = Mock(spec=System)
-    sys_def.group = "default"
-    sys_def.enabled = True
-    sys_def.priority = 0
+def test_update_runs_n_steps(world):
+    sys = make_mock_system()
+
+    world.register_system(sys)
+    world.update(dt=0.5, n_steps=3)
+
+    assert sys.update.call_count == 3
+    sys.update.assert_called_with(world, 0.5)
+
+
+def test_update_systems_parallel_runs_all(world):
+    results = []
+
+    class WritesPosition(System):
+        write_set = (Position,)
+
+        def update(self, w, dt):
+            results.append("pos")
+
+    class WritesVelocity(System):
+        write_set = (Velocity,)
+
+        def update(self, w, dt):
+            results.append("vel")
+
+    world.register_system(WritesPosition())
+    world.register_system(WritesVelocity())
+
+    world.update_systems(1.0, parallel=True)
+
+    assert sorted(results) == ["pos", "vel"]
 
-    sys_ren = Mock(spec=System)
-    sys_ren.group = "render"
-    sys_ren.enabled = True
-    sys_ren.priority = 0
+
+def test_parallel_wave_failure_keeps_sibling_commands(world):
+    errors = []
+
+    class Spawner(System):
+        write_set = (Position,)
+
+        def update(self, w, dt):
+            w.cmd_buffer.create_entity({Position: [1, 1]})
+
+    class Crasher(System):
+        write_set = (Velocity,)
+
+        def update(self, w, dt):
+            w.cmd_buffer.create_entity({Velocity: [2, 2]})
+            raise ValueError("System Crash")
+
+        def on_error(self, w, e):
+            errors.append(e)
+
+    world.register_system(Spawner())
+    world.register_system(Crasher())
+
+    world.update_systems(1.0, parallel=True)
+
+    # the spawner's queued entity survives the sibling failure; the
+    # crasher's own queued entity (and its id reservation) are dropped
+    assert len(world.entities.entities_map) == 1
+    assert sum(len(a) for a in world.query(include=[Position]).matches) == 1
+    assert sum(len(a) for a in world.query(include=[Velocity]).matches) == 0
+    assert len(errors) == 1 and isinstance(errors[0], ValueError)
+
+
+def test_update_respects_groups(world):
+    sys_def = make_mock_system()
+    sys_ren = make_mock_system(group="render")
 
     world.register_system(sys_def)
     world.register_system(sys_ren)
@@ -158,9 +213,7 @@ def test_update_respects_groups(world):
 
 
 def test_update_respects_enabled_flag(world):
-    sys = Mock(spec=System)
-    sys.enabled = False
-    sys.priority = 0
+    sys = make_mock_system(enabled=False)
 
     world.register_system(sys)
     world.update_systems(1.0)
@@ -191,11 +244,7 @@ def test_write_lock_allows_command_buffer(world):
 
 
 def test_system_error_handling(world):
-    sys = Mock(spec=System)
-    sys.enabled = True
-    sys.priority = 0
-    sys.group = "default"
-
+    sys = make_mock_system()
     sys.update.side_effect = ValueError("System Crash")
 
     world.register_system(sys)
@@ -206,14 +255,11 @@ def test_system_error_handling(world):
     assert isinstance(sys.on_error.call_args[0][1], ValueError)
 
 
-def test_full_update_flow(world):
+def test_full_update_flow():
     mock_bus = Mock()
-    world.event_bus = mock_bus
+    world = World(event_bus=mock_bus)
 
-    mock_sys = Mock(spec=System)
-    mock_sys.enabled = True
-    mock_sys.priority = 0
-    mock_sys.group = "default"
+    mock_sys = make_mock_system()
     world.register_system(mock_sys)
 
     world.update(1.0)
@@ -222,8 +268,8 @@ def test_full_update_flow(world):
     mock_bus.update.assert_called_once()
 
 
-def test_flush_is_called(world):
-    world.cmd_buffer = Mock()
+def test_flush_is_called():
+    world = World(cmd_buffer=Mock())
     world.update(1.0)
     assert world.cmd_buffer.flush.call_count >= 1
 
@@ -239,3 +285,21 @@ def test_get_archetype(world):
 def test_get_archetype_invalid(world):
     with pytest.raises(ValueError):
         world.get_archetype(999)
+
+
+def test_reserve_archetype_capacity(world):
+    world.reserve_archetype_capacity([Position, Velocity], 1000)
+    eid = world.create_entity({Position: [0, 0], Velocity: [1, 1]})
+
+    arch = world.get_archetype(eid)
+    assert arch._capacity >= 1000
+
+
+def test_create_entities_bulk(world):
+    ids = world.create_entities(
+        {Position: np.zeros((5, 2)), Velocity: np.ones((5, 2))}, 5
+    )
+
+    assert len(ids) == 5
+    assert world.entity_count == 5
+    assert world.get_component(int(ids[3]), Velocity).tolist() == [1, 1]